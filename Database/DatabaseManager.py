@@ -7,7 +7,7 @@ from dataclasses import dataclass
 
 import pytz
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
-from pymongo import UpdateOne, InsertOne, DeleteOne, ReplaceOne, IndexModel
+from pymongo import UpdateOne, InsertOne, DeleteOne, ReplaceOne, IndexModel, ReturnDocument
 from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
 from dotenv import load_dotenv
 import backoff
@@ -50,7 +50,12 @@ class ConnectionPool:
 			'connectTimeoutMS': 10000,
 			'socketTimeoutMS': 20000,
 			'retryWrites': True,
-			'retryReads': True
+			'retryReads': True,
+			# Fail fast instead of queueing forever when every pooled connection is busy
+			'waitQueueTimeoutMS': 5000,
+			# zlib ships with Python; zstd/snappy would need extra packages
+			'compressors': 'zlib',
+			'appname': f'codex-{connection_name}'
 		}
 		self.client: Optional[AsyncIOMotorClient] = None
 		self._health_check_interval = 30  # seconds
@@ -388,6 +393,50 @@ class CollectionManager:
 			logger.error(f"Error updating documents in {self.name}: {e}")
 			raise
 
+	@with_retry(max_retries=3)
+	async def find_one_and_update(self, filter_dict: Dict[str, Any],
+								  update: Union[Dict[str, Any], List[Dict[str, Any]]],
+								  projection: Dict[str, Any] = None,
+								  return_document: ReturnDocument = ReturnDocument.BEFORE,
+								  upsert: bool = False,
+								  **kwargs) -> Optional[Dict[str, Any]]:
+		"""
+		Atomically update a single document and return it.
+
+		Args:
+			filter_dict: Query filter
+			update: Update operations, or an aggregation pipeline update
+			projection: Fields to include/exclude in the returned document
+			return_document: Whether to return the document before or after the update
+			upsert: Whether to insert if no document matches
+			**kwargs: Additional options for find_one_and_update
+
+		Returns:
+			The matched document (projected), or None if nothing matched
+		"""
+		try:
+			# Add updated_at timestamp
+			now = datetime.now(tz=pytz.UTC)
+			if isinstance(update, list):
+				update = update + [{'$set': {'updated_at': now}}]
+			else:
+				if '$set' not in update:
+					update['$set'] = {}
+				update['$set']['updated_at'] = now
+
+			result = await self.collection.find_one_and_update(filter_dict, update, projection=projection,
+															   return_document=return_document,
+															   upsert=upsert, **kwargs)
+
+			if result is not None or upsert:
+				logger.debug(f"Updated document in {self.name}")
+				self._invalidate_cache()
+
+			return result
+		except Exception as e:
+			logger.error(f"Error updating document in {self.name}: {e}")
+			raise
+
 	@with_retry(max_retries=3)
 	async def replace_one(self, filter_dict: Dict[str, Any],
 						  replacement: Dict[str, Any],
@@ -664,7 +713,9 @@ class DatabaseManager:
 			indexes=[
 				IndexModel([('date', -1)]),
 				IndexModel([('guild_id', 1), ('date', -1)]),
-				IndexModel([('created_at', -1)])
+				IndexModel([('created_at', -1)]),
+				# Least used question per category (get_next_question)
+				IndexModel([('tags', 1), ('used_count', 1)])
 			]
 		)
 
@@ -675,7 +726,21 @@ class DatabaseManager:
 			indexes=[
 				IndexModel([('user_id', 1), ('guild_id', 1)]),
 				IndexModel([('score', -1)]),
-				IndexModel([('updated_at', -1)])
+				IndexModel([('updated_at', -1)]),
+				# One entry per user, so concurrent first-vote upserts can't create duplicates
+				IndexModel([('user_id', 1)], unique=True),
+				# /wyr leaderboard ordering
+				IndexModel([('total_votes', -1)])
+			]
+		)
+
+		# One document per (question, user) vote, so question documents don't grow with every voter
+		self._collection_configs['daily_wyr_votes'] = CollectionConfig(
+			name='WYR_Votes',
+			database='Daily',
+			connection='primary',
+			indexes=[
+				IndexModel([('question_id', 1), ('user_id', 1)], unique=True)
 			]
 		)
 
@@ -1097,6 +1162,11 @@ class DatabaseManager:
 		"""Get Daily WYR Leaderboard collection manager."""
 		return self.get_collection_manager('daily_wyr_leaderboard')
 
+	@property
+	def daily_wyr_votes(self) -> CollectionManager:
+		"""Get Daily WYR Votes collection manager."""
+		return self.get_collection_manager('daily_wyr_votes')
+
 	@property
 	def serverdata_guilds(self) -> CollectionManager:
 		"""Get ServerData Guilds collection manager."""
@@ -392,6 +392,8 @@ class GuideManager:
 		self.navigation = NavigationBreadcrumbs()
 		self.quick_access = QuickAccessManager()
 		self.content_cache = {}
+		# Top-level help menu options, refreshed together with the search index
+		self.menu_options = []
 		self.cache_timestamp = None
 		logger.info("GuideManager initialized successfully")
 
@@ -483,6 +485,7 @@ class GuideManager:
 				# Now build the search index
 				logger.debug("Building search engine index from cached content")
 				self.search_engine.index_content(data)
+				self.menu_options = [{"name": entry["name"], "meta_description": entry["meta_description"]} for entry in data]
 				self.cache_timestamp = datetime.now()
 
 				logger.info(f"Search index built successfully:")
@@ -573,12 +576,10 @@ class GuideManager:
 					logger.info("Cache refresh needed, rebuilding search index")
 					await self._build_search_index()
 
-				# Use DatabaseManager to get the guide menus collection
-				guide_collection = db_manager.get_collection_manager('guide_menues')
-				data = await guide_collection.find_many({}, sort=[('order', 1)])
-				options = [{"name": entry["name"], "meta_description": entry["meta_description"]} for entry in data]
+				# Menu options are loaded with the search index, so a click doesn't hit the database
+				options = self.menu_options
 
-				logger.debug(f"Retrieved {len(data)} categories, created {len(options)} menu options")
+				logger.debug(f"Using {len(options)} cached menu options")
 
 				# Create enhanced embed with additional features
 				embed = discord.Embed(
@@ -1,3 +1,4 @@
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -5,12 +6,39 @@ from typing import Optional
 
 from NewMembers.joining import guild_handler
 from utils.logger import get_logger
-from utils.cooldown import welcome_cooldown
+from utils.cooldown import welcome_cooldown, is_guild_administrator
 
 logger = get_logger("WelcomeTrigger")
 
 WELCOME_CHANNEL_ID = 1371686628510269460
 
+# Lowercased role names that grant access to the welcome commands
+_ALLOWED_ROLES = frozenset({'admin', 'moderator', 'welcome manager', 'staff'})
+
+# Error responses carry no per-user data, so they are built once at import
+_PERMISSION_DENIED_EMBED = discord.Embed(
+    title="❌ Permission Denied",
+    description="You don't have permission to use welcome commands.\nRequired: `Manage Messages` or Admin/Moderator/Staff/Welcome Manager role.",
+    color=discord.Color.red()
+)
+_UNEXPECTED_ERROR_EMBED = discord.Embed(
+    title="❌ Unexpected Error",
+    description="An unexpected error occurred. Please try again later.",
+    color=discord.Color.red()
+)
+_NO_PM_MESSAGE = "❌ This command can only be used in a server."
+# The cooldown description depends on retry_after, so only the rest is cached
+_COOLDOWN_EMBED_TEMPLATE = discord.Embed(
+    title="⏳ Cooldown Active",
+    color=discord.Color.orange()
+).to_dict()
+
+
+def _short(e: BaseException, n: int = 1000) -> str:
+    """Render an exception for an embed, capped at n characters."""
+    text = str(e)
+    return text if len(text) <= n else f"{text:.{n}}…"
+
 
 def has_welcome_permissions_app():
     """App command check for welcome message permissions."""
@@ -19,17 +47,90 @@ def has_welcome_permissions_app():
             return False
 
         user = interaction.user
+        # The welcome cooldown check runs first and has usually memoized the administrator flag
+        if is_guild_administrator(interaction):
+            return True
+
         perms = getattr(user, "guild_permissions", None)
-        if perms and (perms.manage_messages or perms.administrator):
+        if perms and perms.manage_messages:
             return True
 
-        role_names = [role.name.lower() for role in getattr(user, "roles", [])]
-        allowed_roles = {'admin', 'moderator', 'welcome manager', 'staff'}
-        return any(name in allowed_roles for name in role_names)
+        return any(role.name.lower() in _ALLOWED_ROLES for role in getattr(user, "roles", ()))
 
     return app_commands.check(predicate)
 
 
+def _build_success_embed(author_name: str, avatar_url: str, target: discord.abc.User) -> discord.Embed:
+    """Confirmation embed for a successful /welcome test."""
+    embed = discord.Embed(
+        title="✅ Welcome Message Test Complete",
+        description=f"Welcome message sent for {target.mention}",
+        color=discord.Color.green(),
+        timestamp=discord.utils.utcnow()
+    )
+    embed.set_footer(text=f"Tested by {author_name}", icon_url=avatar_url)
+    return embed
+
+
+def _build_error_embed(author_name: str, avatar_url: str, exc: BaseException) -> discord.Embed:
+    """Failure embed for /welcome test."""
+    embed = discord.Embed(
+        title="❌ Welcome Message Test Failed",
+        description=f"An error occurred while testing the welcome message:\n```{_short(exc)}```",
+        color=discord.Color.red(),
+        timestamp=discord.utils.utcnow()
+    )
+    embed.set_footer(text=f"Tested by {author_name}", icon_url=avatar_url)
+    return embed
+
+
+async def _respond(interaction: discord.Interaction, *args, **kwargs):
+    """Send an ephemeral reply, using the followup webhook if the interaction was already answered."""
+    if interaction.response.is_done():
+        await interaction.followup.send(*args, ephemeral=True, **kwargs)
+    else:
+        await interaction.response.send_message(*args, ephemeral=True, **kwargs)
+
+
+async def _handle_check_failure(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    await _respond(interaction, embed=_PERMISSION_DENIED_EMBED)
+
+
+async def _handle_cooldown(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    embed = discord.Embed.from_dict(_COOLDOWN_EMBED_TEMPLATE)
+    embed.description = f"Please wait {int(getattr(error, 'retry_after', 10))} seconds before trying again."
+    await _respond(interaction, embed=embed)
+
+
+async def _handle_no_pm(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    await _respond(interaction, _NO_PM_MESSAGE)
+
+
+async def _handle_unexpected_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    # Runs in a background task outside the except block, so pass the error itself as exc_info
+    logger.error("Unhandled error in welcome commands: %s", error, exc_info=error)
+    await _respond(interaction, embed=_UNEXPECTED_ERROR_EMBED)
+
+
+# Exact-type dispatch for the welcome error handler; most specific types first for the isinstance fallback
+_ERROR_HANDLERS = {
+    app_commands.CommandOnCooldown: _handle_cooldown,
+    app_commands.NoPrivateMessage: _handle_no_pm,
+    app_commands.CheckFailure: _handle_check_failure,
+}
+
+
+# Strong references to in-flight error replies so they aren't garbage collected mid-send
+_background_tasks = set()
+
+
+async def _run_error_handler(handler, interaction: discord.Interaction, error: app_commands.AppCommandError):
+    try:
+        await handler(interaction, error)
+    except Exception as inner_e:
+        logger.error("Error in welcome cog error handler: %s", inner_e, exc_info=True)
+
+
 class WelcomeGroup(commands.GroupCog, name="welcome", description="Welcome system commands"):
     """
     Group cog providing:
@@ -40,8 +141,47 @@ class WelcomeGroup(commands.GroupCog, name="welcome", description="Welcome syste
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.handler = guild_handler
+        self._welcome_channel = None
+        self._info_template = self._build_info_template()
         logger.info("WelcomeGroup initialized")
 
+    @staticmethod
+    def _build_info_template() -> dict:
+        """Build the static part of the /welcome info embed once; per-call fields are added on top."""
+        embed = discord.Embed(
+            title="🔧 Welcome System Information",
+            color=discord.Color.blue()
+        )
+
+        embed.add_field(
+            name="Account Age Requirement",
+            value="60 days",
+            inline=True
+        )
+
+        embed.add_field(
+            name="Commands Available",
+            value="`/welcome test` - Test welcome message\n`/welcome info` - Show this info",
+            inline=False
+        )
+
+        embed.add_field(
+            name="Required Permissions",
+            value="• `Manage Messages`\n• Administrator permission\n• Admin/Moderator/Staff/Welcome Manager role",
+            inline=False
+        )
+
+        return embed.to_dict()
+
+    async def cog_load(self):
+        self._welcome_channel = self.bot.get_channel(WELCOME_CHANNEL_ID)
+
+    def _get_welcome_channel(self):
+        """Return the cached welcome channel, resolving it again if the bot wasn't ready at load."""
+        if self._welcome_channel is None:
+            self._welcome_channel = self.bot.get_channel(WELCOME_CHANNEL_ID)
+        return self._welcome_channel
+
     @app_commands.command(name="test", description="Test the welcome message system for a member (default: you)")
     @app_commands.describe(member="Member to test the welcome message for")
     @has_welcome_permissions_app()
@@ -49,46 +189,42 @@ class WelcomeGroup(commands.GroupCog, name="welcome", description="Welcome syste
     @app_commands.check(welcome_cooldown())
     async def test(self, interaction: discord.Interaction, member: Optional[discord.Member] = None):
         """Slash command to test welcome message."""
-        target_member = member or interaction.user
+        author = interaction.user
+        author_name = str(author)
+        avatar_url = author.display_avatar.url
+        target_member = member or author
+
+        # Start the welcome post right away so its HTTP round-trip overlaps the defer below
+        welcome_task = asyncio.create_task(self.handler.send_welcome_message(target_member, target_member.display_avatar.url))
+        embed = _build_success_embed(author_name, avatar_url, target_member)
 
         # Quick confirmation (ephemeral)
         try:
             await interaction.response.defer(ephemeral=True, thinking=True)
         except discord.InteractionResponded:
             pass
+        except BaseException:
+            # Without the defer there is no followup to report on, so don't leave the post running unobserved
+            welcome_task.cancel()
+            raise
 
         try:
             # Perform the welcome action
-            await self.handler.send_welcome_message(target_member)
+            await welcome_task
 
             # Log the action
             logger.info(
-                f"Welcome test triggered by {interaction.user} ({interaction.user.id}) "
-                f"for {target_member} ({target_member.id})"
+                "Welcome test triggered by %s (%d) for %s (%d)",
+                author_name, author.id, target_member, target_member.id
             )
 
             # Success confirmation
-            embed = discord.Embed(
-                title="✅ Welcome Message Test Complete",
-                description=f"Welcome message sent for {target_member.mention}",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            embed.set_footer(text=f"Tested by {interaction.user}", icon_url=interaction.user.display_avatar.url)
-
             await interaction.followup.send(embed=embed, ephemeral=True)
 
         except Exception as e:
-            logger.error(f"Error during welcome message test: {e}", exc_info=True)
-
-            error_embed = discord.Embed(
-                title="❌ Welcome Message Test Failed",
-                description=f"An error occurred while testing the welcome message:\n```{str(e)[:1000]}```",
-                color=discord.Color.red(),
-                timestamp=discord.utils.utcnow()
-            )
-            error_embed.set_footer(text=f"Tested by {interaction.user}", icon_url=interaction.user.display_avatar.url)
+            logger.error("Error during welcome message test: %s", e, exc_info=True)
 
+            error_embed = _build_error_embed(author_name, avatar_url, e)
             if interaction.followup:
                 await interaction.followup.send(embed=error_embed, ephemeral=True)
 
@@ -97,87 +233,40 @@ class WelcomeGroup(commands.GroupCog, name="welcome", description="Welcome syste
     @app_commands.guild_only()
     async def info(self, interaction: discord.Interaction):
         """Slash command to show welcome system information."""
-        embed = discord.Embed(
-            title="🔧 Welcome System Information",
-            color=discord.Color.blue(),
-            timestamp=discord.utils.utcnow()
-        )
+        # from_dict keeps a reference to the fields list, so hand it a fresh one
+        template = self._info_template
+        embed = discord.Embed.from_dict({**template, "fields": list(template["fields"])})
+        embed.timestamp = discord.utils.utcnow()
 
         # Get welcome channel
-        welcome_channel = self.bot.get_channel(WELCOME_CHANNEL_ID)
+        welcome_channel = self._get_welcome_channel()
 
-        embed.add_field(
+        embed.insert_field_at(
+            0,
             name="Welcome Channel",
             value=welcome_channel.mention if isinstance(welcome_channel, (discord.TextChannel, discord.Thread)) else "❌ Not found",
             inline=True
         )
 
-        embed.add_field(
-            name="Account Age Requirement",
-            value="60 days",
-            inline=True
-        )
-
-        embed.add_field(
-            name="Commands Available",
-            value="`/welcome test` - Test welcome message\n`/welcome info` - Show this info",
-            inline=False
-        )
-
-        embed.add_field(
-            name="Required Permissions",
-            value="• `Manage Messages`\n• Administrator permission\n• Admin/Moderator/Staff/Welcome Manager role",
-            inline=False
-        )
-
-        embed.set_footer(text=f"Requested by {interaction.user}", icon_url=interaction.user.display_avatar.url)
+        author = interaction.user
+        embed.set_footer(text=f"Requested by {author}", icon_url=author.display_avatar.url)
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
         """Unified error handler for the welcome command group."""
-        try:
-            if isinstance(error, app_commands.CheckFailure):
-                embed = discord.Embed(
-                    title="❌ Permission Denied",
-                    description="You don't have permission to use welcome commands.\nRequired: `Manage Messages` or Admin/Moderator/Staff/Welcome Manager role.",
-                    color=discord.Color.red()
-                )
-                if interaction.response.is_done():
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-                else:
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-
-            elif isinstance(error, app_commands.CommandOnCooldown):
-                embed = discord.Embed(
-                    title="⏳ Cooldown Active",
-                    description=f"Please wait {int(getattr(error, 'retry_after', 10))} seconds before trying again.",
-                    color=discord.Color.orange()
-                )
-                if interaction.response.is_done():
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-                else:
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-
-            elif isinstance(error, app_commands.NoPrivateMessage):
-                if interaction.response.is_done():
-                    await interaction.followup.send("❌ This command can only be used in a server.", ephemeral=True)
-                else:
-                    await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-
-            else:
-                logger.error(f"Unhandled error in welcome commands: {error}", exc_info=True)
-                embed = discord.Embed(
-                    title="❌ Unexpected Error",
-                    description="An unexpected error occurred. Please try again later.",
-                    color=discord.Color.red()
-                )
-                if interaction.response.is_done():
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-                else:
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as inner_e:
-            logger.error(f"Error in welcome cog error handler: {inner_e}", exc_info=True)
+        handler = _ERROR_HANDLERS.get(type(error))
+        if handler is None:
+            # Fall back to an isinstance scan for subclasses of the handled errors
+            handler = next(
+                (h for exc_type, h in _ERROR_HANDLERS.items() if isinstance(error, exc_type)),
+                _handle_unexpected_error
+            )
+
+        # Nothing downstream waits on the reply, so send it in the background
+        task = asyncio.create_task(_run_error_handler(handler, interaction, error))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
 
 async def setup(bot: commands.Bot):
@@ -1,7 +1,10 @@
 import asyncio
+import json
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict
-from collections import defaultdict
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
 import aiohttp
 import discord
 from utils.bot import bot, WELCOME_CHANNEL_ID, TOKEN, s
@@ -9,6 +12,257 @@ from utils.cache import cache_manager
 from Guide.guide import get_help_menu
 from utils.logger import get_logger
 
+# Maximum number of channel history requests in flight while initializing a guild cache
+CHANNEL_HISTORY_CONCURRENCY = 10
+# Seconds between write-behind flushes of dirty guilds to the database cache
+CACHE_FLUSH_INTERVAL = 2.0
+# GuildCacheManager method that rewrites each kind of write-behind cache entry
+CACHE_REFRESHERS = {
+	'info': 'cache_guild_info',
+	'roles': 'cache_roles',
+	'channels': 'cache_channels',
+}
+# Attributes GuildCacheManager.cache_roles / cache_channels store; updates touching none of them are skipped
+CACHED_ROLE_FIELDS = ('name', 'color', 'permissions', 'position', 'mentionable', 'hoist', 'managed',
+					  'display_icon', 'unicode_emoji')
+CACHED_CHANNEL_FIELDS = ('name', 'type', 'position', 'overwrites', 'category_id', 'topic', 'slowmode_delay',
+						 'nsfw', 'bitrate', 'user_limit', 'rtc_region', 'default_auto_archive_duration')
+# Most users whose DM token buckets are kept; the least recently seen are evicted first
+MAX_TRACKED_DM_USERS = 10_000
+
+
+@dataclass(slots=True)
+class DMBucket:
+	"""Per-user DM token bucket; refilled lazily from the monotonic timestamp of the last update"""
+	tokens: float
+	ts: float
+
+
+def _cached_fields_changed(before, after, fields: tuple[str, ...]) -> bool:
+	"""Whether an update event changed any attribute the database cache stores"""
+	return any(getattr(before, name, None) != getattr(after, name, None) for name in fields)
+
+
+class AsyncTokenBucket:
+	"""Shared pacer for outgoing Discord calls: holds up to capacity tokens, refilled at rate tokens per second"""
+
+	def __init__(self, rate: float, capacity: int):
+		self.rate = rate
+		self.capacity = capacity
+		self.tokens = float(capacity)
+		self.updated = time.monotonic()
+		# Held while waiting for a refill, so callers are served in arrival order
+		self._lock = asyncio.Lock()
+
+	async def acquire(self, n: int = 1):
+		"""Wait until n tokens are available, then take them"""
+		async with self._lock:
+			while True:
+				now = time.monotonic()
+				self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+				self.updated = now
+				if self.tokens >= n:
+					self.tokens -= n
+					return
+				await asyncio.sleep((n - self.tokens) / self.rate)
+
+	def try_acquire(self, n: int = 1) -> bool:
+		"""Take n tokens if they are available right now; never waits, and never jumps a queued caller"""
+		if self._lock.locked():
+			return False
+		now = time.monotonic()
+		self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+		self.updated = now
+		if self.tokens >= n:
+			self.tokens -= n
+			return True
+		return False
+
+
+# Pacers shared by every join handler, so concurrent joins can't burst past Discord's rate limits
+DM_BUCKET = AsyncTokenBucket(rate=1 / 2, capacity=5)
+KICK_BUCKET = AsyncTokenBucket(rate=2, capacity=4)
+# Message creation is limited to 5 per 5 seconds per channel
+WELCOME_BUCKET = AsyncTokenBucket(rate=1, capacity=5)
+
+
+@dataclass(slots=True)
+class GuildMetrics:
+	"""Flat in-memory metrics for one guild; get_guild_analytics assembles the nested view on demand"""
+	member_count: int = 0
+	bot_count: int = 0
+	online_count: int = 0
+	new_member_joins_today: int = 0
+	kicks_today: int = 0
+	last_activity: float | None = None  # POSIX timestamp; formatted by get_guild_analytics
+	voice_channels_active: int = 0
+	recent_messages: int = 0
+	moderation_actions: list = field(default_factory=list)
+	member_retention_rate: float = 0.0
+	popular_channels: dict = field(default_factory=dict)
+	role_distribution: dict = field(default_factory=dict)
+	timezone_distribution: dict = field(default_factory=dict)
+	hourly_joins: Counter = field(default_factory=Counter)
+	daily_joins: Counter = field(default_factory=Counter)
+	weekly_joins: Counter = field(default_factory=Counter)
+	suspicious_joins: int = 0
+	account_age_violations: int = 0
+	rapid_joins: int = 0
+
+
+# Sentinels spliced into the pre-serialized welcome payload; every other field is static
+_WELCOME_AVATAR = "__WELCOME_AVATAR__"
+_WELCOME_MEMBER_ID = "__WELCOME_MEMBER_ID__"
+_WELCOME_MEMBER_NUMBER = "__WELCOME_MEMBER_NUMBER__"
+_WELCOME_HUMANS = "__WELCOME_HUMANS__"
+_WELCOME_ACTIVE_VC = "__WELCOME_ACTIVE_VC__"
+
+
+def _build_welcome_template() -> bytes:
+	"""Serialize the welcome message payload once, with sentinels in place of the per-member values"""
+	payload = {
+		"flags": 1 << 15,
+		"components": [
+			{
+				"type": 17,
+				"accent_color": 0x5865F2,
+				"components": [
+					{
+						"type": 12,
+						"items": [
+							{
+								"media": {
+									"url": _WELCOME_AVATAR,
+									"description": "Your avatar"
+								}
+							}
+						]
+					},
+					{
+						"type": 10,
+						"content": f"# Welcome to the server, <@{_WELCOME_MEMBER_ID}>!\n*You're member #{_WELCOME_MEMBER_NUMBER}!*"
+					},
+					{
+						"type": 1,
+						"components": [
+							{
+								"type": 2,
+								"label": "✅ Guide",
+								"style": 3,
+								"custom_id": "Need Help?"
+							},
+							{
+								"type": 2,
+								"label": "📜 Rules",
+								"style": 5,
+								"url": "https://discord.com/channels/1265120128295632926/1265122523599863930"
+							},
+							{
+								"type": 2,
+								"label": "🗣️Come Chat!",
+								"style": 5,
+								"url": "https://discord.com/channels/1265120128295632926/1265122926823211018"
+							}
+						]
+					},
+					{
+						"type": 14,
+						"divider": True,
+						"spacing": 2
+					},
+					{
+						"type": 10,
+						"content": (f":wave: Welcome to the Discord server!\n"
+									f"We are a community of {_WELCOME_HUMANS} gamers and love that you made it here.\n"
+									f"Feedback is welcome and helpful.\n"
+									f"Use `/suggest` to start your suggestion in #suggestions.\n"
+									f"Don't want your name on it? Use the anonymous option!\n")
+					},
+					{
+						"type": 14,
+						"divider": True,
+						"spacing": 1
+					},
+					{
+						"type": 10,
+						"content": "🎮 Some other channels you might like\n"
+					},
+					{
+						"type": 1,
+						"components": [
+							{
+								"type": 2,
+								"style": 5,
+								"label": "📷 Media",
+								"url": "https://discord.com/channels/1265120128295632926/1265122765279727657"
+							},
+							{
+								"type": 2,
+								"style": 5,
+								"label": "🎮 Game Clips",
+								"url": "https://discord.com/channels/1265120128295632926/1265123462284836935"
+							},
+							{
+								"type": 2,
+								"style": 5,
+								"label": "💬 Gamer Chat",
+								"url": "https://discord.com/channels/1265120128295632926/1265123424892616705"
+							}
+						]
+					},
+					{
+						"type": 14,
+						"divider": True,
+						"spacing": 1
+					},
+					{
+						"type": 10,
+						"content": (
+							"**Explore and have fun!**\n"
+							"- Play games like UNO, TicTacToe, Hangman\n"
+							"- Compete in leaderboards\n"
+							f"- Join voice chat and events 🎤 ({_WELCOME_ACTIVE_VC} active now!)"
+						)
+					}
+				]
+			}
+		]
+	}
+
+	return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def _split_template(template: bytes, sentinels: tuple[str, ...]) -> tuple[bytes, ...]:
+	"""Cut a serialized template at each sentinel (in order) into the static fragments around them"""
+	fragments = []
+	rest = template
+	for sentinel in sentinels:
+		head, found, rest = rest.partition(sentinel.encode())
+		if not found:
+			raise ValueError(f"Sentinel {sentinel} missing from welcome template")
+		fragments.append(head)
+	fragments.append(rest)
+	return tuple(fragments)
+
+
+# DM sent to accounts too new to join, before they are kicked
+_REJECT_DM_TEMPLATE = (
+	"Hey {name}! 👋\n\n"
+	"Unfortunately, your Discord account is too new to join our server (created {days} days ago).\n"
+	"We require accounts to be a certain number of days old to help prevent spam and protect our community.\n\n"
+	"You're welcome to try again once your account is older. Thanks for understanding! 🙏"
+)
+
+# REST endpoint the welcome payload is posted to
+_WELCOME_URL = f"https://discord.com/api/v10/channels/{WELCOME_CHANNEL_ID}/messages"
+
+# Static JSON fragments between the per-member values, in payload order:
+# avatar URL, member id, member number, human members, active voice channels
+_WELCOME_FRAGMENTS = _split_template(
+	_build_welcome_template(),
+	(_WELCOME_AVATAR, _WELCOME_MEMBER_ID, _WELCOME_MEMBER_NUMBER, _WELCOME_HUMANS, _WELCOME_ACTIVE_VC)
+)
+
 
 class GuildEventHandler:
 	"""Handles all guild-related events with enhanced caching and rate limiting"""
@@ -18,219 +272,329 @@ class GuildEventHandler:
 		self.cache_manager = cache_manager
 		self.logger = get_logger("GuildEventHandler")
 
-		# Enhanced guild-specific rate limiting storage
-		self.dm_rate_limits: Dict[int, Dict[str, Any]] = defaultdict(lambda: {
-			'count': 0,
-			'last_reset': datetime.now(timezone.utc),
-			'blocked_until': None,
-			'total_attempts': 0,
-			'first_attempt': None
-		})
+		# Shared HTTP session for raw REST calls (welcome messages); created lazily on first use
+		self._session: aiohttp.ClientSession | None = None
+		self._session_lock = asyncio.Lock()
+		self._headers = {
+			'Authorization': f"Bot {TOKEN}",
+			'Content-Type': 'application/json'
+		}
+
+		# Guilds whose database cache entries are stale, per CACHE_REFRESHERS kind; written behind by _flush_loop
+		self._dirty_guilds: Dict[str, set[int]] = {kind: set() for kind in CACHE_REFRESHERS}
+		self._flusher_task: asyncio.Task | None = None
+
+		# (date ordinal, day key, week key) for join-pattern bucketing; recomputed once per day
+		self._join_period_keys: tuple[int, str, str] = (0, '', '')
+
+		# Enhanced guild-specific rate limiting storage, kept in least-recently-seen order
+		self.dm_rate_limits: OrderedDict[int, DMBucket] = OrderedDict()
 
 		# Enhanced guild cache with more comprehensive data
-		self.guild_cache: Dict[int, Dict[str, Any]] = defaultdict(lambda: {
-			'member_count': 0,
-			'bot_count': 0,
-			'online_count': 0,
-			'new_member_joins_today': 0,
-			'kicks_today': 0,
-			'last_activity': None,
-			'voice_channels_active': 0,
-			'recent_messages': 0,
-			'moderation_actions': [],
-			'member_retention_rate': 0.0,
-			'popular_channels': {},
-			'role_distribution': {},
-			'timezone_distribution': {},
-			'join_patterns': {
-				'hourly': defaultdict(int),
-				'daily': defaultdict(int),
-				'weekly': defaultdict(int)
-			},
-			'security_metrics': {
-				'suspicious_joins': 0,
-				'account_age_violations': 0,
-				'rapid_joins': 0
-			}
-		})
+		# Entries are created explicitly (see _guild_metrics) so read paths never materialize one
+		self.guild_cache: Dict[int, GuildMetrics] = {}
+		# One initialize_guild_cache task per guild; concurrent first events all await the same pass
+		self._guild_init_tasks: Dict[int, asyncio.Task] = {}
+
+		# Members whose new-account DM/kick is in flight, so a redelivered join isn't handled twice,
+		# and strong references to those tasks so they aren't garbage collected mid-run
+		self._rejecting: set[int] = set()
+		self._background_tasks: set[asyncio.Task] = set()
+
+		# Button custom_id -> handler for component interactions
+		self._component_handlers = {
+			"Need Help?": self._handle_help_button,
+		}
 
 		# Rate limit configuration - can be guild-specific
 		self.rate_limits = {
 			'new_account_days': 30,
 			'max_dms_per_hour': 2,
 			'max_dms_per_day': 5,
-			'block_duration_hours': 24,
 		}
 
+	async def _get_session(self) -> aiohttp.ClientSession:
+		"""Return the shared HTTP session, creating it (and its connection pool) on first use"""
+		if self._session is None or self._session.closed:
+			async with self._session_lock:
+				if self._session is None or self._session.closed:
+					self._session = aiohttp.ClientSession(
+						connector=aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75),
+						cookie_jar=aiohttp.DummyCookieJar(),
+						headers=self._headers
+					)
+		return self._session
+
+	async def close(self):
+		"""Stop the cache flusher and close the shared HTTP session"""
+		task, self._flusher_task = self._flusher_task, None
+		if task is not None:
+			task.cancel()
+			try:
+				# A flush cut short puts its batch back (see _flush_dirty_guilds), so wait for that first
+				await task
+			except asyncio.CancelledError:
+				pass
+			except Exception as e:
+				self.logger.error("Cache flusher failed: %s", e)
+			await self._flush_dirty_guilds()
+
+		if self._session is not None and not self._session.closed:
+			await self._session.close()
+		self._session = None
+
+	def _mark_guild_dirty(self, guild: discord.Guild, kind: str = 'info'):
+		"""Queue a guild's cache entry of the given kind for the next flush, starting the flusher if needed"""
+		self._dirty_guilds[kind].add(guild.id)
+		if self._flusher_task is None or self._flusher_task.done():
+			self._flusher_task = asyncio.create_task(self._flush_loop())
+
+	async def _flush_loop(self):
+		"""Write dirty guilds to the database cache every CACHE_FLUSH_INTERVAL seconds"""
+		while True:
+			await asyncio.sleep(CACHE_FLUSH_INTERVAL)
+			try:
+				await self._flush_dirty_guilds()
+			except Exception as e:
+				self.logger.error("Error flushing dirty guild caches: %s", e)
+
+	async def _flush_dirty_guilds(self):
+		dirty, self._dirty_guilds = self._dirty_guilds, {kind: set() for kind in CACHE_REFRESHERS}
+		if self.cache_manager is None:
+			# The cache manager failed to start (see attach_databases); there is nothing to write to
+			if any(dirty.values()):
+				self.logger.warning("Skipping guild cache flush, no cache manager is available")
+			return
+
+		pending = []
+		for kind, guild_ids in dirty.items():
+			for guild in map(self.bot.get_guild, guild_ids):
+				if guild is None:
+					continue
+				try:
+					pending.append((kind, guild, getattr(self.cache_manager, CACHE_REFRESHERS[kind])(guild)))
+				except Exception as e:
+					self.logger.error("Error flushing %s cache for %s: %s", kind, guild.name, e)
+		if not pending:
+			return
+
+		try:
+			results = await asyncio.gather(*(call for _, _, call in pending), return_exceptions=True)
+		except asyncio.CancelledError:
+			# Cancelled by close(): put the batch back so its final flush still writes these guilds
+			for kind, guild_ids in dirty.items():
+				self._dirty_guilds[kind] |= guild_ids
+			raise
+		for (kind, guild, _), result in zip(pending, results):
+			if isinstance(result, Exception):
+				self.logger.error("Error flushing %s cache for %s: %s", kind, guild.name, result)
+
 	async def initialize_guild_cache(self, guild: discord.Guild):
 		"""Initialize comprehensive guild cache data"""
 		try:
-			self.logger.info(f"Initializing comprehensive guild cache for {guild.name} ({guild.id})")
-
-			cache_data = self.guild_cache[guild.id]
-
-			# Basic guild metrics
-			cache_data['member_count'] = guild.member_count
-			cache_data['bot_count'] = sum(1 for member in guild.members if member.bot)
-			cache_data['online_count'] = sum(1 for member in guild.members
-											 if hasattr(member, 'status') and member.status != discord.Status.offline)
-
-			# Voice channel activity
-			cache_data['voice_channels_active'] = sum(1 for vc in guild.voice_channels if vc.members)
-
-			# Role distribution
-			role_dist = defaultdict(int)
-			for member in guild.members:
-				for role in member.roles:
-					if not role.is_default():
-						role_dist[role.name] += 1
-			cache_data['role_distribution'] = dict(role_dist)
-
-			# Channel activity estimation (simplified)
-			channel_activity = {}
-			for channel in guild.text_channels:
-				try:
-					# Get recent message count (last 24 hours)
-					recent_count = 0
-					async for message in channel.history(after=datetime.now(timezone.utc) - timedelta(hours=24),
-														 limit=100):
-						recent_count += 1
-					channel_activity[channel.name] = recent_count
-				except (discord.Forbidden, discord.HTTPException):
-					channel_activity[channel.name] = 0
-
-			cache_data['popular_channels'] = dict(sorted(channel_activity.items(),
-														 key=lambda x: x[1], reverse=True)[:5])
-
-			# Initialize today's counters
-			cache_data['new_member_joins_today'] = 0
-			cache_data['kicks_today'] = 0
-			cache_data['last_activity'] = datetime.now(timezone.utc).isoformat()
-
-			# Security metrics initialization
-			cache_data['security_metrics']['suspicious_joins'] = 0
-			cache_data['security_metrics']['account_age_violations'] = 0
-			cache_data['security_metrics']['rapid_joins'] = 0
-
-			self.logger.info(f"Guild cache initialized: {guild.member_count} members, "
-							 f"{cache_data['bot_count']} bots, {cache_data['online_count']} online")
+			self.logger.info("Initializing comprehensive guild cache for %s (%s)", guild.name, guild.id)
+
+			cache_data = self._fill_member_stats(guild)
+
+			# Channel activity estimation (simplified) - recent message count (last 24 hours),
+			# fetched concurrently but capped to stay inside Discord's per-route rate limits
+			cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+			history_semaphore = asyncio.Semaphore(CHANNEL_HISTORY_CONCURRENCY)
+
+			async def count_recent(channel: discord.TextChannel) -> tuple[str, int]:
+				async with history_semaphore:
+					try:
+						return channel.name, sum([1 async for _ in channel.history(after=cutoff, limit=100)])
+					except (discord.Forbidden, discord.HTTPException):
+						return channel.name, 0
+
+			channel_activity = dict(await asyncio.gather(*(count_recent(c) for c in guild.text_channels)))
+
+			cache_data.popular_channels = dict(sorted(channel_activity.items(),
+													  key=lambda x: x[1], reverse=True)[:5])
+
+			# Today's and security counters start at zero in a fresh GuildMetrics; resetting them here would
+			# wipe joins, kicks and DMs counted while the history scan was running
+			cache_data.last_activity = time.time()
+
+			self.logger.info("Guild cache initialized: %s members, %s bots, %s online",
+							 guild.member_count, cache_data.bot_count, cache_data.online_count)
 
 		except Exception as e:
-			self.logger.error(f"Error initializing guild cache for {guild.name}: {e}")
+			self.logger.error("Error initializing guild cache for %s: %s", guild.name, e)
+
+	def _fill_member_stats(self, guild: discord.Guild) -> GuildMetrics:
+		"""Fill in the guild's member, bot, online, role and voice counts from the gateway cache, without awaiting"""
+		cache_data = self._guild_metrics(guild.id)
+
+		# Basic guild metrics and role distribution, gathered in a single pass over the members
+		bots = online = 0
+		role_dist = Counter()
+		offline = discord.Status.offline
+		default_role_id = guild.id  # @everyone shares the guild's id
+		for member in guild.members:
+			if member.bot:
+				bots += 1
+			if member.status is not offline:
+				online += 1
+			role_dist.update(role.name for role in member.roles if role.id != default_role_id)
+
+		cache_data.member_count = guild.member_count
+		cache_data.bot_count = bots
+		cache_data.online_count = online
+		cache_data.role_distribution = dict(role_dist)
+
+		# Voice channel activity
+		cache_data.voice_channels_active = sum(1 for vc in guild.voice_channels if vc.members)
+		return cache_data
+
+	def _guild_init_task(self, guild: discord.Guild) -> asyncio.Task:
+		"""Return the guild's initialize_guild_cache task, starting it if this is the first request"""
+		task = self._guild_init_tasks.get(guild.id)
+		if task is None:
+			task = self._guild_init_tasks[guild.id] = asyncio.create_task(self.initialize_guild_cache(guild))
+		return task
+
+	async def ensure_guild_cache(self, guild: discord.Guild):
+		"""Initialize a guild's cache exactly once, waiting on the pass already running if there is one"""
+		# Shielded so a cancelled caller doesn't abort the initialization other callers are waiting on
+		await asyncio.shield(self._guild_init_task(guild))
+
+	def warm_guild_caches(self, guilds):
+		"""Start cache initialization for each guild in the background, ahead of its first member join"""
+		for guild in guilds:
+			self._guild_init_task(guild)
 
 	async def update_guild_metrics(self, guild: discord.Guild, event_type: str, **kwargs):
 		"""Update guild metrics based on events"""
 		try:
-			cache_data = self.guild_cache[guild.id]
+			cache_data = self._guild_metrics(guild.id)
 			now = datetime.now(timezone.utc)
 
 			if event_type == "member_join":
-				cache_data['new_member_joins_today'] += 1
-				cache_data['member_count'] = guild.member_count
+				cache_data.new_member_joins_today += 1
+				cache_data.member_count = guild.member_count
 
 				# Track join patterns
 				hour = now.hour
-				day = now.strftime('%Y-%m-%d')
-				week = now.strftime('%Y-W%U')
+				day, week = self._join_period(now)
 
-				cache_data['join_patterns']['hourly'][hour] += 1
-				cache_data['join_patterns']['daily'][day] += 1
-				cache_data['join_patterns']['weekly'][week] += 1
+				cache_data.hourly_joins[hour] += 1
+				cache_data.daily_joins[day] += 1
+				cache_data.weekly_joins[week] += 1
 
 				# Check for rapid joins (security metric)
-				recent_joins = cache_data['join_patterns']['hourly'][hour]
+				recent_joins = cache_data.hourly_joins[hour]
 				if recent_joins > 10:  # More than 10 joins in an hour
-					cache_data['security_metrics']['rapid_joins'] += 1
+					cache_data.rapid_joins += 1
 
 				member = kwargs.get('member')
 				if member:
-					account_age = now - member.created_at
-					if account_age.days < self.rate_limits['new_account_days']:
-						cache_data['security_metrics']['account_age_violations'] += 1
+					age_days = (now.timestamp() - member.created_at.timestamp()) / 86400
+					if age_days < self.rate_limits['new_account_days']:
+						cache_data.account_age_violations += 1
 
 			elif event_type == "member_remove":
-				cache_data['member_count'] = guild.member_count
+				cache_data.member_count = guild.member_count
 
 			elif event_type == "member_kick":
-				cache_data['kicks_today'] += 1
+				cache_data.kicks_today += 1
 
-			cache_data['last_activity'] = now.isoformat()
+			cache_data.last_activity = now.timestamp()
 
-			# Update database cache periodically
-			await self.cache_manager.cache_guild_info(guild)
+			# Update database cache periodically (write-behind, coalesced per guild)
+			self._mark_guild_dirty(guild)
 
 		except Exception as e:
-			self.logger.error(f"Error updating guild metrics for {guild.name}: {e}")
+			self.logger.error("Error updating guild metrics for %s: %s", guild.name, e)
+
+	def _guild_metrics(self, guild_id: int) -> GuildMetrics:
+		"""Return the metrics entry for a guild, creating it on first write"""
+		metrics = self.guild_cache.get(guild_id)
+		if metrics is None:
+			metrics = self.guild_cache[guild_id] = GuildMetrics()
+		return metrics
+
+	def _join_period(self, now: datetime) -> tuple[str, str]:
+		"""Return the day ('%Y-%m-%d') and week ('%Y-W%U') keys for now, formatting them only when the date changes"""
+		ordinal = now.toordinal()
+		cached_ordinal, day, week = self._join_period_keys
+		if ordinal != cached_ordinal:
+			day = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+			week = now.strftime('%Y-W%U')
+			self._join_period_keys = (ordinal, day, week)
+		return day, week
 
 	async def get_guild_analytics(self, guild_id: int) -> Dict[str, Any]:
 		"""Get comprehensive guild analytics"""
-		cache_data = self.guild_cache.get(guild_id, {})
+		cache_data = self.guild_cache.get(guild_id)
+		if cache_data is None:
+			cache_data = GuildMetrics()
 
 		analytics = {
 			'basic_stats': {
-				'total_members': cache_data.get('member_count', 0),
-				'bot_count': cache_data.get('bot_count', 0),
-				'human_members': cache_data.get('member_count', 0) - cache_data.get('bot_count', 0),
-				'online_members': cache_data.get('online_count', 0)
+				'total_members': cache_data.member_count,
+				'bot_count': cache_data.bot_count,
+				'human_members': cache_data.member_count - cache_data.bot_count,
+				'online_members': cache_data.online_count
 			},
 			'activity_stats': {
-				'joins_today': cache_data.get('new_member_joins_today', 0),
-				'kicks_today': cache_data.get('kicks_today', 0),
-				'active_voice_channels': cache_data.get('voice_channels_active', 0),
-				'popular_channels': cache_data.get('popular_channels', {})
+				'joins_today': cache_data.new_member_joins_today,
+				'kicks_today': cache_data.kicks_today,
+				'active_voice_channels': cache_data.voice_channels_active,
+				'popular_channels': cache_data.popular_channels
+			},
+			'security_metrics': {
+				'suspicious_joins': cache_data.suspicious_joins,
+				'account_age_violations': cache_data.account_age_violations,
+				'rapid_joins': cache_data.rapid_joins
 			},
-			'security_metrics': cache_data.get('security_metrics', {}),
-			'join_patterns': cache_data.get('join_patterns', {}),
-			'role_distribution': cache_data.get('role_distribution', {}),
-			'last_updated': cache_data.get('last_activity')
+			'join_patterns': {
+				'hourly': cache_data.hourly_joins,
+				'daily': cache_data.daily_joins,
+				'weekly': cache_data.weekly_joins
+			},
+			'role_distribution': cache_data.role_distribution,
+			'last_updated': (datetime.fromtimestamp(cache_data.last_activity, timezone.utc).isoformat()
+							 if cache_data.last_activity else None)
 		}
 
 		return analytics
 
-	async def can_send_dm(self, member: discord.Member) -> tuple[bool, str]:
-		"""Enhanced DM rate limiting with guild-specific tracking"""
-		now = datetime.now(timezone.utc)
-		account_age = now - member.created_at
-
+	async def can_send_dm(self, member: discord.Member, age_days: float) -> tuple[bool, str]:
+		"""Enhanced DM rate limiting with guild-specific tracking; age_days is computed by the caller"""
 		# Only apply rate limits to new accounts
-		if account_age.days >= self.rate_limits['new_account_days']:
+		if age_days >= self.rate_limits['new_account_days']:
 			return True, "Account old enough"
 
-		user_limits = self.dm_rate_limits[member.id]
-
-		# Initialize first attempt tracking
-		if user_limits['first_attempt'] is None:
-			user_limits['first_attempt'] = now
-
-		user_limits['total_attempts'] += 1
-
-		# Check if user is currently blocked
-		if user_limits.get('blocked_until') and now < user_limits['blocked_until']:
-			remaining = user_limits['blocked_until'] - now
-			return False, f"Blocked for {remaining.seconds // 3600}h {(remaining.seconds % 3600) // 60}m"
-
-		# Reset counters if needed (hourly reset)
-		if now - user_limits['last_reset'] >= timedelta(hours=1):
-			user_limits['count'] = 0
-			user_limits['last_reset'] = now
-			user_limits['blocked_until'] = None
-
-		# Check hourly limit
-		if user_limits['count'] >= self.rate_limits['max_dms_per_hour']:
-			# Block the user
-			user_limits['blocked_until'] = now + timedelta(hours=self.rate_limits['block_duration_hours'])
-			self.logger.warning(
-				f"User {member} ({member.id}) hit DM rate limit, blocked for {self.rate_limits['block_duration_hours']} hours"
-			)
-			return False, "Rate limit exceeded"
-
+		# Token bucket: holds up to max_dms_per_hour tokens and refills at the same rate per hour
+		capacity = self.rate_limits['max_dms_per_hour']
+		rate = capacity / 3600
+		mono_now = time.monotonic()
+
+		bucket = self.dm_rate_limits.get(member.id)
+		if bucket is None:
+			bucket = self.dm_rate_limits[member.id] = DMBucket(capacity, mono_now)
+		else:
+			bucket.tokens = min(capacity, bucket.tokens + (mono_now - bucket.ts) * rate)
+			bucket.ts = mono_now
+			self.dm_rate_limits.move_to_end(member.id)
+
+		# Bound memory under join floods by evicting the least recently seen users
+		while len(self.dm_rate_limits) > MAX_TRACKED_DM_USERS:
+			self.dm_rate_limits.popitem(last=False)
+
+		if bucket.tokens < 1:
+			wait = (1 - bucket.tokens) / rate
+			self.logger.warning("User %s (%s) hit DM rate limit, next DM allowed in %sm", member, member.id, int(wait // 60))
+			return False, f"Rate limit exceeded, retry in {int(wait // 3600)}h {int(wait % 3600) // 60}m"
+
+		bucket.tokens -= 1
+		self.logger.info("DM tokens left for %s (%s): %.2f", member, member.id, bucket.tokens)
 		return True, "Within limits"
 
 	async def record_dm_sent(self, member: discord.Member):
 		"""Record that a DM was sent with enhanced tracking"""
-		user_limits = self.dm_rate_limits[member.id]
-		user_limits['count'] += 1
-
 		# Update guild security metrics
 		await self.update_guild_metrics(
 			member.guild,
@@ -239,266 +603,194 @@ class GuildEventHandler:
 			reason="account_age_restriction"
 		)
 
-		self.logger.info(f"DM count for {member} ({member.id}): {user_limits['count']}")
-
 	async def handle_member_join(self, member: discord.Member):
 		"""Handle member join with comprehensive tracking and caching"""
-		self.logger.info(f"\n{s}New member joined: {member} ({member.id}) in {member.guild.name}\n")
+		self.logger.info("\n%sNew member joined: %s (%s) in %s\n", s, member, member.id, member.guild.name)
 
-		now = datetime.now(timezone.utc)
-		account_age = now - member.created_at
+		# Float day count from POSIX timestamps; int() of it matches timedelta.days for display
+		age_days = (time.time() - member.created_at.timestamp()) / 86400
 		guild = member.guild
 
+		# The initialization scans channel history, so the join never waits on it; until it finishes,
+		# the counts the welcome message shows are read straight from the gateway cache
+		if not self._guild_init_task(guild).done():
+			self._fill_member_stats(guild)
 		# Update guild metrics
 		await self.update_guild_metrics(guild, "member_join", member=member)
 
-		# Initialize guild cache if needed
-		if guild.id not in self.guild_cache:
-			await self.initialize_guild_cache(guild)
-
-		# Default avatar fallback
-		avatar_url = member.display_avatar.url if member.display_avatar else "https://cdn.discordapp.com/embed/avatars/0.png"
-
-		if account_age.days < 90:
-			# Account is too new — check if we can send DM with rate limiting
-			can_dm, reason = await self.can_send_dm(member)
-
-			if can_dm:
-				try:
-					await member.send(
-						f"Hey {member.name}! 👋\n\n"
-						f"Unfortunately, your Discord account is too new to join our server (created {account_age.days} days ago).\n"
-						f"We require accounts to be a certain number of days old to help prevent spam and protect our community.\n\n"
-						f"You're welcome to try again once your account is older. Thanks for understanding! 🙏"
-					)
-					await self.record_dm_sent(member)
-					self.logger.info(f"\n{s}Sent DM to {member} about new account restriction.\n")
-				except discord.Forbidden:
-					self.logger.warning(f"\n{s}Could not DM {member} before kick (Forbidden).\n")
-				except Exception as e:
-					self.logger.error(f"\n{s}Failed to DM {member}: {e}")
-			else:
-				self.logger.info(f"\n{s}Skipped DM to {member} due to rate limiting: {reason}\n")
-
-			try:
-				await asyncio.sleep(1.2)
-				await member.kick(reason=f"Account too new ({account_age.days} days old)")
-				await self.update_guild_metrics(guild, "member_kick", member=member)
-				self.logger.info(f"\n{s}Kicked {member} due to account age ({account_age.days} days).\n")
-			except Exception as e:
-				self.logger.error(f"\n{s}Failed to kick {member}: {e}\n")
-
-			await asyncio.sleep(1.2)
+		if age_days < 90:
+			# Account is too new; the DM and kick are paced, so run them without holding up this handler
+			if member.id not in self._rejecting:
+				self._rejecting.add(member.id)
+				self._spawn(self._run_reject_new_account(member, age_days))
 			return
 
 		# Account is old enough - proceed with welcome
 		channel = member.guild.get_channel(WELCOME_CHANNEL_ID)
 		if channel:
+			# Upsert only the new member, in the background so the welcome isn't held up by the database
+			self._spawn(self._cache_joined_member(member))
+
 			try:
-				# Update members cache for this guild
-				await self.cache_manager.cache_members(member.guild)
-				self.logger.info(f"\n{s}Member cache updated for {member.guild.name}\n")
+				await self.send_welcome_message(member, member.display_avatar.url)
+				self.logger.info("Interactive welcome message sent for %s\n", member)
 			except Exception as e:
-				self.logger.error(f"\n{s}Error updating member cache for {member.guild.name}: {e}\n")
+				self.logger.error("Error sending welcome message: %s\n", e)
 
+	def _spawn(self, coro):
+		"""Run a coroutine as a task, keeping a strong reference until it finishes"""
+		task = asyncio.create_task(coro)
+		self._background_tasks.add(task)
+		task.add_done_callback(self._background_tasks.discard)
+		return task
+
+	async def _cache_joined_member(self, member: discord.Member):
+		try:
+			await self.cache_manager.cache_member(member.guild, member)
+			self.logger.info("\n%sMember cache updated for %s\n", s, member.guild.name)
+		except Exception as e:
+			self.logger.error("\n%sError updating member cache for %s: %s\n", s, member.guild.name, e)
+
+	async def _run_reject_new_account(self, member: discord.Member, age_days: float):
+		"""Background wrapper for _reject_new_account that logs failures and clears the in-flight entry"""
+		try:
+			await self._reject_new_account(member, age_days)
+		except Exception as e:
+			self.logger.error("\n%sError rejecting new account %s: %s\n", s, member, e, exc_info=True)
+		finally:
+			self._rejecting.discard(member.id)
+
+	async def _reject_new_account(self, member: discord.Member, age_days: float):
+		"""DM a too-new account about the age requirement (rate limited), then kick it"""
+		guild = member.guild
+		account_days = int(age_days)
+
+		# The DM is a courtesy; during a raid the kick must not queue behind the DM pacer. The pacer is
+		# checked first so a skipped DM doesn't spend one of the member's own hourly DM tokens
+		if DM_BUCKET.try_acquire():
+			# Check if we can send DM with rate limiting
+			can_dm, reason = await self.can_send_dm(member, age_days)
+		else:
+			can_dm, reason = False, "DM pacer is out of tokens"
+
+		if can_dm:
 			try:
-				await asyncio.sleep(1.2)
-				await self.send_welcome_message(member)
-				self.logger.info(f"Interactive welcome message sent for {member}\n")
+				await member.send(_REJECT_DM_TEMPLATE.format(name=member.name, days=account_days))
+				await self.record_dm_sent(member)
+				self.logger.info("\n%sSent DM to %s about new account restriction.\n", s, member)
+			except discord.Forbidden:
+				self.logger.warning("\n%sCould not DM %s before kick (Forbidden).\n", s, member)
 			except Exception as e:
-				self.logger.error(f"Error sending welcome message: {e}\n")
+				self.logger.error("\n%sFailed to DM %s: %s", s, member, e)
+		else:
+			self.logger.info("\n%sSkipped DM to %s due to rate limiting: %s\n", s, member, reason)
 
-	async def send_welcome_message(self, member: discord.Member, avatar_url: str = None):
-		"""Send enhanced welcome message with guild-specific data"""
-		url = f"https://discord.com/api/v10/channels/{WELCOME_CHANNEL_ID}/messages"
-		if avatar_url is None:
-			avatar_url = member.display_avatar.url if member.display_avatar else "https://cdn.discordapp.com/embed/avatars/0.png"
-
-		headers = {
-			'Authorization': f"Bot {TOKEN}",
-			'Content-Type': 'application/json'
-		}
+		try:
+			await KICK_BUCKET.acquire()
+			await member.kick(reason=f"Account too new ({account_days} days old)")
+			await self.update_guild_metrics(guild, "member_kick", member=member)
+			self.logger.info("\n%sKicked %s due to account age (%s days).\n", s, member, account_days)
+		except Exception as e:
+			self.logger.error("\n%sFailed to kick %s: %s\n", s, member, e)
 
+	async def send_welcome_message(self, member: discord.Member, avatar_url: str):
+		"""Send enhanced welcome message with guild-specific data"""
+		# avatar_url comes from member.display_avatar, which falls back to the default avatar itself
 		# Get guild analytics for personalized welcome
 		analytics = await self.get_guild_analytics(member.guild.id)
 		member_number = analytics['basic_stats']['total_members']
 
-		json_payload = {
-			"flags": 1 << 15,
-			"components": [
-				{
-					"type": 17,
-					"accent_color": 0x5865F2,
-					"components": [
-						{
-							"type": 12,
-							"items": [
-								{
-									"media": {
-										"url": avatar_url,
-										"description": "Your avatar"
-									}
-								}
-							]
-						},
-						{
-							"type": 10,
-							"content": f"# Welcome to the server, <@{member.id}>!\n*You're member #{member_number}!*"
-						},
-						{
-							"type": 1,
-							"components": [
-								{
-									"type": 2,
-									"label": "✅ Guide",
-									"style": 3,
-									"custom_id": "Need Help?"
-								},
-								{
-									"type": 2,
-									"label": "📜 Rules",
-									"style": 5,
-									"url": "https://discord.com/channels/1265120128295632926/1265122523599863930"
-								},
-								{
-									"type": 2,
-									"label": "🗣️Come Chat!",
-									"style": 5,
-									"url": "https://discord.com/channels/1265120128295632926/1265122926823211018"
-								}
-							]
-						},
-						{
-							"type": 14,
-							"divider": True,
-							"spacing": 2
-						},
-						{
-							"type": 10,
-							"content": (f":wave: Welcome to the Discord server!\n"
-										f"We are a community of {analytics['basic_stats']['human_members']} gamers and love that you made it here.\n"
-										f"Feedback is welcome and helpful.\n"
-										f"Use `/suggest` to start your suggestion in #suggestions.\n"
-										f"Don't want your name on it? Use the anonymous option!\n")
-						},
-						{
-							"type": 14,
-							"divider": True,
-							"spacing": 1
-						},
-						{
-							"type": 10,
-							"content": "🎮 Some other channels you might like\n"
-						},
-						{
-							"type": 1,
-							"components": [
-								{
-									"type": 2,
-									"style": 5,
-									"label": "📷 Media",
-									"url": "https://discord.com/channels/1265120128295632926/1265122765279727657"
-								},
-								{
-									"type": 2,
-									"style": 5,
-									"label": "🎮 Game Clips",
-									"url": "https://discord.com/channels/1265120128295632926/1265123462284836935"
-								},
-								{
-									"type": 2,
-									"style": 5,
-									"label": "💬 Gamer Chat",
-									"url": "https://discord.com/channels/1265120128295632926/1265123424892616705"
-								}
-							]
-						},
-						{
-							"type": 14,
-							"divider": True,
-							"spacing": 1
-						},
-						{
-							"type": 10,
-							"content": (
-								"**Explore and have fun!**\n"
-								"- Play games like UNO, TicTacToe, Hangman\n"
-								"- Compete in leaderboards\n"
-								f"- Join voice chat and events 🎤 ({analytics['activity_stats']['active_voice_channels']} active now!)"
-							)
-						}
-					]
-				}
-			]
-		}
-
-		async with aiohttp.ClientSession() as session:
-			async with session.post(url, headers=headers, json=json_payload) as resp:
-				self.logger.info(f"\n{s}[WELCOME] Status: {resp.status}\n")
-				if resp.status != 200:
-					self.logger.error(f"Failed to send welcome message: {await resp.text()}")
+		f = _WELCOME_FRAGMENTS
+		body = b''.join((
+			f[0], json.dumps(avatar_url)[1:-1].encode(),
+			f[1], str(member.id).encode(),
+			f[2], str(member_number).encode(),
+			f[3], str(analytics['basic_stats']['human_members']).encode(),
+			f[4], str(analytics['activity_stats']['active_voice_channels']).encode(),
+			f[5]
+		))
+
+		session = await self._get_session()
+		await WELCOME_BUCKET.acquire()
+		async with session.post(_WELCOME_URL, data=body) as resp:
+			self.logger.info("\n%s[WELCOME] Status: %s\n", s, resp.status)
+			# Only read the body on failure; on success aiohttp can hand the connection straight back to the pool
+			if not resp.ok:
+				self.logger.error("Failed to send welcome message: %s", await resp.text())
 
 	async def handle_interaction(self, interaction: discord.Interaction):
 		"""Handle button interactions"""
-		author_id = interaction.user.id
-		if interaction.type == discord.InteractionType.component:
-			if interaction.data["custom_id"] == "Need Help?":
-				from Guide.guide import get_help_menu
-				embed, view = await get_help_menu(author_id)
-				await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+		if interaction.type is not discord.InteractionType.component:
+			return
+
+		handler = self._component_handlers.get(interaction.data.get("custom_id"))
+		if handler is not None:
+			await handler(interaction)
+
+	async def _handle_help_button(self, interaction: discord.Interaction):
+		embed, view = await get_help_menu(interaction.user.id)
+		await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
 
 	async def handle_member_remove(self, member: discord.Member):
 		"""Handle member removal with enhanced tracking"""
-		self.logger.info(f"\n{s}Member left: {member.name} ({member.id}) in guild: {member.guild.name}\n")
+		self.logger.info("\n%sMember left: %s (%s) in guild: %s\n", s, member.name, member.id, member.guild.name)
 
 		# Update guild metrics
 		await self.update_guild_metrics(member.guild, "member_remove", member=member)
 
-		# Clean up rate limit data for users who leave
-		if member.id in self.dm_rate_limits:
-			del self.dm_rate_limits[member.id]
-			self.logger.info(f"Cleaned up rate limit data for {member.id}")
-
 		try:
-			# Update members cache for this guild
-			await self.cache_manager.cache_members(member.guild)
-			self.logger.info(f"\n{s}Member cache updated for {member.guild.name}\n")
+			# Drop only the departed member instead of re-caching the whole guild
+			await self.cache_manager.remove_member(member.guild.id, member.id)
+			self.logger.info("\n%sMember cache updated for %s\n", s, member.guild.name)
 		except Exception as e:
-			self.logger.error(f"\n{s}Error updating member cache for {member.guild.name}: {e}\n")
+			self.logger.error("\n%sError updating member cache for %s: %s\n", s, member.guild.name, e)
 
 	async def handle_guild_role_update(self, before: discord.Role, after: discord.Role):
 		"""Handle role updates with caching"""
-		self.logger.info(f"\n{s}Role updated: {after.name} ({after.id}) in guild: {after.guild.name}\n")
+		self.logger.info("\n%sRole updated: %s (%s) in guild: %s\n", s, after.name, after.id, after.guild.name)
+
+		# Update guild role distribution cache. Member counts don't change on a role update,
+		# so only a rename needs handling: move the count to the new name
+		guild_data = self.guild_cache.get(after.guild.id)
+		if guild_data is not None and before.name != after.name:
+			guild = after.guild
+			if any(role.name == before.name for role in guild.roles):
+				# Another role still uses the old name, so its share of the count can't be split off
+				self.rebuild_role_distribution(guild)
+			else:
+				role_dist = guild_data.role_distribution
+				if before.name in role_dist:
+					role_dist[after.name] = role_dist.get(after.name, 0) + role_dist.pop(before.name)
+
+		# Update roles cache for this guild; bursts of role edits coalesce into one write
+		if _cached_fields_changed(before, after, CACHED_ROLE_FIELDS):
+			self._mark_guild_dirty(after.guild, 'roles')
+
+	def rebuild_role_distribution(self, guild: discord.Guild):
+		"""Recount role membership across the whole guild, if the guild is being tracked"""
+		guild_data = self.guild_cache.get(guild.id)
+		if guild_data is None:
+			return
 
-		# Update guild role distribution cache
-		guild_data = self.guild_cache[after.guild.id]
-		role_dist = defaultdict(int)
-		for member in after.guild.members:
-			for role in member.roles:
-				if not role.is_default():
-					role_dist[role.name] += 1
-		guild_data['role_distribution'] = dict(role_dist)
-
-		try:
-			# Update roles cache for this guild
-			await self.cache_manager.cache_roles(after.guild)
-			self.logger.info(f"\n{s}Roles cache updated for {after.guild.name}\n")
-		except Exception as e:
-			self.logger.error(f"Error updating roles cache for {after.guild.name}: {e}\n")
+		default_role_id = guild.id  # @everyone shares the guild's id
+		role_dist = Counter(role.name for member in guild.members for role in member.roles
+							if role.id != default_role_id)
+		guild_data.role_distribution = dict(role_dist)
 
 	async def handle_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
 		"""Handle channel updates with caching"""
-		self.logger.info(f"\n{s}Channel updated: {after.name} ({after.id}) in guild: {after.guild.name}\n")
-		try:
-			# Update channels cache for this guild
-			await self.cache_manager.cache_channels(after.guild)
-			self.logger.info(f"\n{s}Channels cache updated for {after.guild.name}\n")
-		except Exception as e:
-			self.logger.error(f"\n{s}Error updating channels cache for {after.guild.name}: {e}\n")
+		self.logger.info("\n%sChannel updated: %s (%s) in guild: %s\n", s, after.name, after.id, after.guild.name)
+		# Update channels cache for this guild; bursts of channel edits coalesce into one write
+		if _cached_fields_changed(before, after, CACHED_CHANNEL_FIELDS):
+			self._mark_guild_dirty(after.guild, 'channels')
 
 
 # Create the guild event handler instance
 guild_handler = GuildEventHandler(bot, cache_manager)
+# This module is first imported while cogs load from on_ready, after the startup guild_available
+# events have already been dispatched, so warm the guilds that are already available here
+if bot.is_ready():
+	guild_handler.warm_guild_caches(bot.guilds)
 
 
 # Keep your existing event handlers but delegate to the class
@@ -532,19 +824,19 @@ async def on_guild_channel_update(before: discord.abc.GuildChannel, after: disco
 @bot.event
 async def on_member_update(before, after):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_member_update - {before.id} in {getattr(before, 'guild', 'N/A')}")
+	guild_handler.logger.info("Event: on_member_update - %s in %s", before.id, getattr(before, 'guild', 'N/A'))
 	pass
 
 @bot.event
 async def on_member_ban(guild, user):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_member_ban - {user} in {guild.name} ({guild.id})")
+	guild_handler.logger.info("Event: on_member_ban - %s in %s (%s)", user, guild.name, guild.id)
 	pass
 
 @bot.event
 async def on_member_unban(guild, user):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_member_unban - {user} in {guild.name} ({guild.id})")
+	guild_handler.logger.info("Event: on_member_unban - %s in %s (%s)", user, guild.name, guild.id)
 	pass
 
 # Section: Connection / Lifecycle
@@ -578,39 +870,42 @@ async def on_resumed():
 # - on_audit_log_entry_create
 @bot.event
 async def on_guild_join(guild):
-	guild_handler.logger.info(f"Event: on_guild_join - joined guild {guild.name} ({guild.id})")
+	guild_handler.logger.info("Event: on_guild_join - joined guild %s (%s)", guild.name, guild.id)
 	# Optionally initialize cache for new guild
 	try:
-		await guild_handler.initialize_guild_cache(guild)
+		await guild_handler.ensure_guild_cache(guild)
 	except Exception as e:
-		guild_handler.logger.error(f"Error initializing cache on guild join: {e}")
+		guild_handler.logger.error("Error initializing cache on guild join: %s", e)
 	pass
 
 @bot.event
 async def on_guild_remove(guild):
-	guild_handler.logger.info(f"Event: on_guild_remove - removed from guild {guild.name} ({guild.id})")
-	# Clean up guild cache if present
+	guild_handler.logger.info("Event: on_guild_remove - removed from guild %s (%s)", guild.name, guild.id)
+	# Clean up guild cache if present; a still-running init would otherwise recreate the entry
+	init_task = guild_handler._guild_init_tasks.pop(guild.id, None)
+	if init_task:
+		init_task.cancel()
 	if guild.id in guild_handler.guild_cache:
 		del guild_handler.guild_cache[guild.id]
-		guild_handler.logger.info(f"Cleared cache for guild {guild.id}")
+		guild_handler.logger.info("Cleared cache for guild %s", guild.id)
 	pass
 
 @bot.event
 async def on_guild_update(before, after):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_guild_update - {after.name} ({after.id})")
+	guild_handler.logger.info("Event: on_guild_update - %s (%s)", after.name, after.id)
 	pass
 
 @bot.event
 async def on_guild_available(guild):
-	#ToDO
-	guild_handler.logger.info(f"Event: on_guild_available - {guild.name} ({guild.id})")
-	pass
+	guild_handler.logger.info("Event: on_guild_available - %s (%s)", guild.name, guild.id)
+	# Warm the join cache ahead of the guild's first member join
+	guild_handler.warm_guild_caches((guild,))
 
 @bot.event
 async def on_guild_unavailable(guild):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_guild_unavailable - {guild.name} ({guild.id})")
+	guild_handler.logger.info("Event: on_guild_unavailable - %s (%s)", guild.name, guild.id)
 	pass
 
 # Section: Roles
@@ -618,23 +913,17 @@ async def on_guild_unavailable(guild):
 # - (None)
 @bot.event
 async def on_guild_role_create(role):
-	guild_handler.logger.info(f"Event: on_guild_role_create - {role.name} ({role.id}) in {role.guild.name}")
-	# update role distribution cache
-	try:
-		await guild_handler.handle_guild_role_update(role, role)
-	except Exception:
-		# fallback to cache refresh
-		await guild_handler.cache_manager.cache_roles(role.guild)
+	guild_handler.logger.info("Event: on_guild_role_create - %s (%s) in %s", role.name, role.id, role.guild.name)
+	# refresh roles cache (a new role has no members yet, so the distribution is unchanged)
+	guild_handler._mark_guild_dirty(role.guild, 'roles')
 	pass
 
 @bot.event
 async def on_guild_role_delete(role):
-	guild_handler.logger.info(f"Event: on_guild_role_delete - {role.name} ({role.id}) in {role.guild.name}")
+	guild_handler.logger.info("Event: on_guild_role_delete - %s (%s) in %s", role.name, role.id, role.guild.name)
+	guild_handler.rebuild_role_distribution(role.guild)
 	# refresh roles cache
-	try:
-		await guild_handler.cache_manager.cache_roles(role.guild)
-	except Exception as e:
-		guild_handler.logger.error(f"Error updating roles cache after delete: {e}")
+	guild_handler._mark_guild_dirty(role.guild, 'roles')
 	pass
 
 # Section: Emojis and Stickers
@@ -643,7 +932,7 @@ async def on_guild_role_delete(role):
 @bot.event
 async def on_guild_emojis_update(guild, before, after):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_guild_emojis_update - {guild.name} ({guild.id})")
+	guild_handler.logger.info("Event: on_guild_emojis_update - %s (%s)", guild.name, guild.id)
 	pass
 
 # Section: Webhooks and Integrations
@@ -653,7 +942,7 @@ async def on_guild_emojis_update(guild, before, after):
 @bot.event
 async def on_webhooks_update(channel):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_webhooks_update - channel {getattr(channel, 'name', channel.id)}")
+	guild_handler.logger.info("Event: on_webhooks_update - channel %s", getattr(channel, 'name', channel.id))
 	pass
 
 # Section: Channels
@@ -666,13 +955,13 @@ async def on_webhooks_update(channel):
 @bot.event
 async def on_channel_create(channel):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_channel_create - {getattr(channel, 'name', channel.id)} in {getattr(channel, 'guild', 'DM')}")
+	guild_handler.logger.info("Event: on_channel_create - %s in %s", getattr(channel, 'name', channel.id), getattr(channel, 'guild', 'DM'))
 	pass
 
 @bot.event
 async def on_channel_delete(channel):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_channel_delete - {getattr(channel, 'name', channel.id)}")
+	guild_handler.logger.info("Event: on_channel_delete - %s", getattr(channel, 'name', channel.id))
 	pass
 
 # Section: Threads
@@ -682,19 +971,19 @@ async def on_channel_delete(channel):
 @bot.event
 async def on_thread_create(thread):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_thread_create - {thread.name} ({thread.id})")
+	guild_handler.logger.info("Event: on_thread_create - %s (%s)", thread.name, thread.id)
 	pass
 
 @bot.event
 async def on_thread_update(before, after):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_thread_update - {after.name} ({after.id})")
+	guild_handler.logger.info("Event: on_thread_update - %s (%s)", after.name, after.id)
 	pass
 
 @bot.event
 async def on_thread_delete(thread):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_thread_delete - {thread.name} ({thread.id})")
+	guild_handler.logger.info("Event: on_thread_delete - %s (%s)", thread.name, thread.id)
 	pass
 
 # Section: Voice and Presence
@@ -702,7 +991,7 @@ async def on_thread_delete(thread):
 # - (None)
 @bot.event
 async def on_voice_state_update(member, before, after):
-	guild_handler.logger.info(f"Event: on_voice_state_update - {member} in {member.guild.name}")
+	guild_handler.logger.info("Event: on_voice_state_update - %s in %s", member, member.guild.name)
 	# update voice channel counts in cache if present
 	try:
 		await guild_handler.update_guild_metrics(member.guild, "voice_state_change", member=member)
@@ -713,7 +1002,7 @@ async def on_voice_state_update(member, before, after):
 @bot.event
 async def on_presence_update(before, after):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_presence_update - {getattr(after, 'id', 'N/A')}")
+	guild_handler.logger.info("Event: on_presence_update - %s", getattr(after, 'id', 'N/A'))
 	pass
 
 # Section: Users and Typing
@@ -722,13 +1011,13 @@ async def on_presence_update(before, after):
 @bot.event
 async def on_user_update(before, after):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_user_update - {after.id}")
+	guild_handler.logger.info("Event: on_user_update - %s", after.id)
 	pass
 
 @bot.event
 async def on_typing(channel, user, when):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_typing - {user} in {getattr(channel, 'name', channel.id)} at {when}")
+	guild_handler.logger.info("Event: on_typing - %s in %s at %s", user, getattr(channel, 'name', channel.id), when)
 	pass
 
 # Section: Messages
@@ -742,32 +1031,32 @@ async def on_message(message):
 	# Ignore bot messages
 	if message.author.bot:
 		return
-	guild_handler.logger.info(f"Event: on_message - {message.author} in {getattr(message.guild, 'name', 'DM')}")
+	guild_handler.logger.info("Event: on_message - %s in %s", message.author, getattr(message.guild, 'name', 'DM'))
 	# Keep default processing intact (commands, etc.)
 	await bot.process_commands(message)
 
 @bot.event
 async def on_message_edit(before, after):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_message_edit - message {before.id}")
+	guild_handler.logger.info("Event: on_message_edit - message %s", before.id)
 	pass
 
 @bot.event
 async def on_message_delete(message):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_message_delete - message {getattr(message, 'id', 'raw')}")
+	guild_handler.logger.info("Event: on_message_delete - message %s", getattr(message, 'id', 'raw'))
 	pass
 
 @bot.event
 async def on_raw_message_delete(payload):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_raw_message_delete - id {payload.message_id}")
+	guild_handler.logger.info("Event: on_raw_message_delete - id %s", payload.message_id)
 	pass
 
 @bot.event
 async def on_message_delete_bulk(messages):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_message_delete_bulk - {len(messages)} messages")
+	guild_handler.logger.info("Event: on_message_delete_bulk - %s messages", len(messages))
 	pass
 
 # Section: Reactions
@@ -778,31 +1067,31 @@ async def on_message_delete_bulk(messages):
 @bot.event
 async def on_reaction_add(reaction, user):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_reaction_add - {user} reacted in {getattr(reaction.message, 'id', 'N/A')}")
+	guild_handler.logger.info("Event: on_reaction_add - %s reacted in %s", user, getattr(reaction.message, 'id', 'N/A'))
 	pass
 
 @bot.event
 async def on_reaction_remove(reaction, user):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_reaction_remove - {user} removed reaction")
+	guild_handler.logger.info("Event: on_reaction_remove - %s removed reaction", user)
 	pass
 
 @bot.event
 async def on_reaction_clear(message, reactions):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_reaction_clear - cleared on message {getattr(message, 'id', 'N/A')}")
+	guild_handler.logger.info("Event: on_reaction_clear - cleared on message %s", getattr(message, 'id', 'N/A'))
 	pass
 
 @bot.event
 async def on_raw_reaction_add(payload):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_raw_reaction_add - {payload}")
+	guild_handler.logger.info("Event: on_raw_reaction_add - %s", payload)
 	pass
 
 @bot.event
 async def on_raw_reaction_remove(payload):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_raw_reaction_remove - {payload}")
+	guild_handler.logger.info("Event: on_raw_reaction_remove - %s", payload)
 	pass
 
 # Section: Invites
@@ -811,11 +1100,11 @@ async def on_raw_reaction_remove(payload):
 @bot.event
 async def on_invite_create(invite):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_invite_create - {invite.code} to {invite.guild}")
+	guild_handler.logger.info("Event: on_invite_create - %s to %s", invite.code, invite.guild)
 	pass
 
 @bot.event
 async def on_invite_delete(invite):
 	#ToDO
-	guild_handler.logger.info(f"Event: on_invite_delete - invite deleted")
+	guild_handler.logger.info("Event: on_invite_delete - invite deleted")
 	pass
\ No newline at end of file
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import sys
 
 import discord
 from tabulate import tabulate
@@ -162,6 +163,15 @@ async def shutdown_handler():
 	except Exception as e:
 		logger.error(f"Error stopping status rotation: {e}", exc_info=True)
 
+	# Close the welcome handler's shared HTTP session, if the module was loaded
+	try:
+		joining = sys.modules.get("NewMembers.joining")
+		if joining is not None:
+			await joining.guild_handler.close()
+			logger.info("Guild event handler HTTP session closed")
+	except Exception as e:
+		logger.error(f"Error closing guild event handler session: {e}", exc_info=True)
+
 	# Close bot connection
 	try:
 		if not bot.is_closed():
@@ -229,6 +239,12 @@ if __name__ == "__main__":
 	import signal
 	import sys
 
+	# uvloop is a faster drop-in event loop; it isn't available on Windows, so fall back to asyncio there
+	try:
+		import uvloop
+	except ImportError:
+		uvloop = None
+
 
 	# Set up signal handlers for graceful shutdown
 	def signal_handler(signum, frame):
@@ -241,7 +257,11 @@ if __name__ == "__main__":
 
 	try:
 		logger.info(f"=== Starting {APPLICATION_NAME} ===")
-		asyncio.run(start_services())
+		if uvloop is not None:
+			logger.info("Using uvloop event loop")
+			uvloop.run(start_services())
+		else:
+			asyncio.run(start_services())
 	except KeyboardInterrupt:
 		logger.info("Received keyboard interrupt signal")
 	except SystemExit:
@@ -1,11 +1,17 @@
+import asyncio
 import random
+import re
 import logging
 import os
-from datetime import datetime, timedelta, timezone
-import pytz
+import time
+from collections import OrderedDict
+from datetime import datetime, time as dt_time, timezone
+from zoneinfo import ZoneInfo
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
+from bson import ObjectId
+from pymongo import UpdateOne
 from dotenv import load_dotenv
 
 from utils.bot import s
@@ -20,13 +26,42 @@ POST_CHANNEL_ID = 1322177352758984764  # Channel where questions are posted
 OPTION1_EMOJI = "1️⃣"  # Reaction for option 1
 OPTION2_EMOJI = "2️⃣"  # Reaction for option 2
 
+# Fields needed to post a question; leaves out the per-user votes map older questions still carry (read by record_vote)
+QUESTION_PROJECTION = {"option1": 1, "option2": 1, "tags": 1, "used_count": 1}
+# Seconds a per-category question count is reused for random picks
+QUESTION_COUNT_TTL = 600
+# Seconds a user fetched over REST for the leaderboard is reused
+USER_FETCH_TTL = 3600
+# Seconds computed question results are reused across Show Results clicks
+RESULTS_CACHE_TTL = 5.0
+# Seconds between leaderboard bulk writes
+LEADERBOARD_FLUSH_INTERVAL = 1.0
+# Most leaderboard updates held while the database is failing; the oldest are dropped beyond this
+LEADERBOARD_QUEUE_LIMIT = 10_000
+# Question embeds kept for reuse, least recently used evicted first
+EMBED_CACHE_SIZE = 256
+# Results progress bars, indexed by filled cells (each cell is 5%)
+BAR_LENGTH = 20
+# Leaderboard markers for the top three rows, and for everyone after them
+_RANK_EMOJI = ("🥇", "🥈", "🥉")
+_DEFAULT_RANK_EMOJI = "🏅"
+_BAR_TABLE = tuple("█" * i + "░" * (BAR_LENGTH - i) for i in range(BAR_LENGTH + 1))
+
 # Scheduling constants
 TARGET_HOUR = 6
-TARGET_TIMEZONE = pytz.timezone("America/Chicago")
+TARGET_TIMEZONE = ZoneInfo("America/Chicago")
+DAILY_POST_TIME = dt_time(hour=TARGET_HOUR, tzinfo=TARGET_TIMEZONE)
+# The next question is loaded a minute ahead so the post itself doesn't wait on Mongo
+PREFETCH_TIME = dt_time(hour=TARGET_HOUR - 1, minute=59, tzinfo=TARGET_TIMEZONE)
 
 logger = get_logger("WYR")
 
 
+def _discussion_thread_name():
+	"""Thread name for a posted question, dated in Chicago time."""
+	return f" WYR Discussion - {datetime.now(TARGET_TIMEZONE):%m/%d}"
+
+
 class WYRCommandGroup(app_commands.Group):
 	"""Command group for Would You Rather commands"""
 
@@ -63,12 +98,15 @@ class WYRCommandGroup(app_commands.Group):
 				embed = self.cog.create_question_embed(question)
 				view = WYRView(question["_id"], self.cog)
 
-				await interaction.response.send_message(embed=embed, view=view)
-				message = await interaction.original_response()
+				# The callback response already carries the sent message, so no extra fetch is needed
+				callback = await interaction.response.send_message(embed=embed, view=view)
+				message = callback.resource
+				if not isinstance(message, discord.InteractionMessage):
+					message = await interaction.original_response()
 
 				# Create a discussion thread
 				thread = await message.create_thread(
-					name=f" WYR Discussion - {datetime.now().strftime('%m/%d')}",
+					name=_discussion_thread_name(),
 					auto_archive_duration=1440
 				)
 
@@ -172,10 +210,21 @@ class WYRCommandGroup(app_commands.Group):
 														ephemeral=True)
 				return
 
-			# Todo Link message id to suggestion id
-			logger.info(f"WYR results feature not yet implemented - requested by {interaction.user}")
-			await interaction.response.send_message(
-				"Results feature coming soon! We need to store message IDs with questions.", ephemeral=True)
+			# The question id is carried in the buttons' custom_id, so no message -> question lookup is needed
+			question_id = _question_id_from_message(message)
+			if question_id is None:
+				logger.warning(f"WYR message {message_id} has no question buttons - requested by {interaction.user}")
+				await interaction.response.send_message(
+					"That question was posted before results lookup was available.", ephemeral=True)
+				return
+
+			results = await self.cog.get_question_results(question_id)
+			if not results:
+				await interaction.response.send_message("❌ Could not fetch results.", ephemeral=True)
+				return
+
+			await interaction.response.send_message(embed=_build_results_embed(results), ephemeral=True)
+			logger.info(f"Showed results for question {question_id} to {interaction.user}")
 
 		except (ValueError, discord.NotFound):
 			logger.warning(f"Invalid or not found message ID {message_id} requested by {interaction.user}")
@@ -211,17 +260,22 @@ class WYRCommandGroup(app_commands.Group):
 					color=discord.Color.gold()
 				)
 
+				async def resolve(user_data):
+					return await self.cog.resolve_user(int(user_data["user_id"]))
+
+				# Resolve every row concurrently; cache misses fetch in parallel rather than one after another
+				users = await asyncio.gather(*(resolve(user_data) for user_data in top_users), return_exceptions=True)
+
 				leaderboard_text = ""
-				for i, user_data in enumerate(top_users, 1):
-					try:
-						user = await self.cog.bot.fetch_user(int(user_data["user_id"]))
-						emoji = "" if i == 1 else "" if i == 2 else "" if i == 3 else ""
-						vote_count = user_data["total_votes"]
-						leaderboard_text += f"{emoji} **{i}.** {user.mention} - {vote_count:,} votes\n"
-					except:
-						vote_count = user_data["total_votes"]
+				for i, (user_data, user) in enumerate(zip(top_users, users), 1):
+					vote_count = user_data["total_votes"]
+					if isinstance(user, BaseException):
 						leaderboard_text += f" **{i}.** Unknown User - {vote_count:,} votes\n"
 						logger.warning(f"Could not fetch user data for user ID {user_data.get('user_id')}")
+						continue
+
+					emoji = _RANK_EMOJI[i - 1] if i <= len(_RANK_EMOJI) else _DEFAULT_RANK_EMOJI
+					leaderboard_text += f"{emoji} **{i}.** {user.mention} - {vote_count:,} votes\n"
 
 				embed.description = leaderboard_text
 				embed.set_footer(text=f"Showing top {min(limit, len(top_users))} voters")
@@ -273,7 +327,26 @@ class WYRCommandGroup(app_commands.Group):
 class WYR(commands.Cog):
 	def __init__(self, bot):
 		self.bot = bot
-		self.bot.loop.create_task(self.initialize_database())
+		# category -> (monotonic expiry, question count), used for random picks
+		self._question_counts = {}
+		# user_id -> (monotonic expiry, user) for leaderboard users not in the bot's cache
+		self._fetched_users = {}
+		# question _id -> (monotonic expiry, results) for repeated Show Results clicks
+		self._results_cache = {}
+		# Resolved lazily on the first scheduled post
+		self._post_channel = None
+		# question _id -> base question embed, without the results field
+		self._embed_cache: OrderedDict = OrderedDict()
+		# Pending leaderboard upserts, written in one bulk_write per flush
+		self._leaderboard_queue = []
+		# Question loaded by the prefetch loop for the upcoming daily post
+		self._prefetched_question = None
+		# Strong references to setup work started from the cog, so it can be cancelled on unload
+		self._background_tasks = set()
+		self._spawn(self.initialize_database())
+
+		# Buttons on posted questions resolve back to this cog through their custom_id
+		self.bot.add_dynamic_items(WYRButton)
 
 		# Add the command group to the bot
 		self.wyr_commands = WYRCommandGroup(self)
@@ -285,9 +358,32 @@ class WYR(commands.Cog):
 		"""Clean up when cog is unloaded"""
 		logger.info("WYR cog unloading - cleaning up")
 
+		for task in self._background_tasks:
+			task.cancel()
+		self.daily_post_loop.cancel()
+		self.prefetch_loop.cancel()
+		# Let a flush that is mid-write finish rather than cancelling it with its batch swapped out
+		self.leaderboard_flush_loop.stop()
+		flush_task = self.leaderboard_flush_loop.get_task()
+		if flush_task is not None and not flush_task.done():
+			try:
+				await flush_task
+			except Exception as e:
+				logger.error(f"Leaderboard flush loop failed during unload: {e}", exc_info=True)
+		# Write out votes queued since the last flush
+		await self.flush_leaderboard_queue()
+
+		self.bot.remove_dynamic_items(WYRButton)
 		self.bot.tree.remove_command("wyr")
 		logger.info("WYR command group removed from bot tree")
 
+	def _spawn(self, coro):
+		"""Run a coroutine as a task, keeping a strong reference until it finishes"""
+		task = asyncio.create_task(coro)
+		self._background_tasks.add(task)
+		task.add_done_callback(self._background_tasks.discard)
+		return task
+
 	async def initialize_database(self):
 		"""
 		Initialize the database connection using the new DatabaseManager.
@@ -300,84 +396,91 @@ class WYR(commands.Cog):
 
 				logger.info(f"{s}✅ WYR database initialized successfully")
 
-				# Start the timer after database is ready
-				await self.schedule_next_post()
+				# Start the daily scheduler after database is ready
+				if not self.daily_post_loop.is_running():
+					self.daily_post_loop.start()
+				if not self.prefetch_loop.is_running():
+					self.prefetch_loop.start()
+				if not self.leaderboard_flush_loop.is_running():
+					self.leaderboard_flush_loop.start()
 
 		except Exception as e:
 			logger.error(f"{s}❌ Failed to initialize WYR database: {e}", exc_info=True)
 
-	async def get_next_6am_chicago(self):
+	@tasks.loop(time=DAILY_POST_TIME)
+	async def daily_post_loop(self):
 		"""
-		Calculate the next 6 AM Chicago time from now.
+		Post the daily WYR question every day at 6 AM Chicago time.
 		"""
-		try:
-			# Get current time in Chicago timezone
-			chicago_now = datetime.now(TARGET_TIMEZONE)
-			logger.info(f"Current Chicago time: {chicago_now}")
+		question, self._prefetched_question = self._prefetched_question, None
+		await self.post_daily_question(question)
 
-			# Create today's 6 AM in Chicago timezone
-			today_6am = chicago_now.replace(hour=TARGET_HOUR, minute=0, second=0, microsecond=0)
-
-			# If it's already past 6 AM today, schedule for tomorrow
-			if chicago_now >= today_6am:
-				next_6am = today_6am + timedelta(days=1)
-			else:
-				next_6am = today_6am
-
-			logger.info(f"Next scheduled WYR post: {next_6am} ({next_6am.strftime('%A, %B %d at %I:%M %p %Z')})")
-			return next_6am
-
-		except Exception as e:
-			logger.error(f"Error calculating next 6 AM Chicago time: {e}", exc_info=True)
-			# Fallback: schedule for 1 hour from now
-			return datetime.now(TARGET_TIMEZONE) + timedelta(hours=1)
-
-	async def schedule_next_post(self):
+	@tasks.loop(time=PREFETCH_TIME)
+	async def prefetch_loop(self):
 		"""
-		Schedule the next WYR post for 6 AM Chicago time.
+		Load the next daily question shortly before it is posted.
 		"""
-		try:
-			with PerformanceLogger(logger, "schedule_next_wyr_post"):
-				next_post_time = await self.get_next_6am_chicago()
-
-				# Convert to UTC for discord.utils.sleep_until
-				next_post_utc = next_post_time.astimezone(timezone.utc)
+		self._prefetched_question = await self.get_next_question()
+		if self._prefetched_question:
+			logger.info(f"Prefetched daily WYR question {self._prefetched_question['_id']}")
 
-				# Calculate time until next post
-				now_utc = datetime.now(timezone.utc)
-				time_until_post = next_post_utc - now_utc
-
-				logger.info(f"Scheduling next WYR post in {time_until_post} at {next_post_utc} UTC")
+	@tasks.loop(seconds=LEADERBOARD_FLUSH_INTERVAL)
+	async def leaderboard_flush_loop(self):
+		"""
+		Periodically write queued leaderboard updates.
+		"""
+		await self.flush_leaderboard_queue()
 
-				# Sleep until the scheduled time
-				await discord.utils.sleep_until(next_post_utc)
+	async def flush_leaderboard_queue(self):
+		"""
+		Write all queued leaderboard updates in a single unordered bulk_write.
+		"""
+		if not self._leaderboard_queue:
+			return
 
-				# Post the question
-				await self.post_daily_question()
+		# Swap the queue out so votes arriving during the write go into the next batch
+		batch, self._leaderboard_queue = self._leaderboard_queue, []
+		try:
+			result = await db_manager.daily_wyr_leaderboard.bulk_write(batch, ordered=False)
+		except Exception as e:
+			# Some of these $inc upserts may already be applied, so retrying the batch could double count
+			logger.error(f"Error flushing {len(batch)} leaderboard updates, dropping them: {e}", exc_info=True)
+			return
 
-				# Schedule the next post (24 hours later)
-				self.bot.loop.create_task(self.schedule_next_post())
+		# bulk_write reports per-operation failures instead of raising; only those are retried
+		errors = result.get("errors") or []
+		if errors:
+			failed = [batch[error["index"]] for error in errors]
+			logger.warning(f"{len(failed)} of {len(batch)} leaderboard updates failed, retrying next flush")
+			self._leaderboard_queue[:0] = failed
+			self._trim_leaderboard_queue()
+		logger.debug(f"Flushed {len(batch) - len(errors)} leaderboard updates")
 
-		except Exception as e:
-			logger.error(f"Error scheduling next WYR post: {e}", exc_info=True)
-			# Fallback: try again in 1 hour
-			await discord.utils.sleep_until(datetime.now(timezone.utc) + timedelta(hours=1))
-			self.bot.loop.create_task(self.schedule_next_post())
+	def _trim_leaderboard_queue(self):
+		"""Keep the leaderboard queue within LEADERBOARD_QUEUE_LIMIT, dropping the oldest updates."""
+		overflow = len(self._leaderboard_queue) - LEADERBOARD_QUEUE_LIMIT
+		if overflow > 0:
+			del self._leaderboard_queue[:overflow]
+			logger.error(f"Leaderboard queue full, dropped the {overflow} oldest updates")
 
-	async def post_daily_question(self):
+	async def post_daily_question(self, question=None):
 		"""
 		Post a daily WYR question in the designated channel.
+		Uses the given (prefetched) question, or queries for one if none was supplied.
 		"""
 		logger.info("Posting scheduled daily WYR question (6 AM Chicago time)")
 
 		try:
 			with PerformanceLogger(logger, "scheduled_daily_wyr_post"):
-				question = await self.get_next_question()
+				if question is None:
+					question = await self.get_next_question()
 				if not question:
 					logger.warning("No SFW questions available for scheduled daily post - skipping")
 					return
 
-				channel = self.bot.get_channel(POST_CHANNEL_ID)
+				if self._post_channel is None:
+					self._post_channel = self.bot.get_channel(POST_CHANNEL_ID)
+				channel = self._post_channel
 				if not channel:
 					logger.error(f"Channel with ID {POST_CHANNEL_ID} not found for scheduled daily post")
 					return
@@ -387,9 +490,8 @@ class WYR(commands.Cog):
 				message = await channel.send(content="<@&1392926433734820014>", embed=embed, view=view)
 
 				# Create a discussion thread
-				chicago_now = datetime.now(TARGET_TIMEZONE)
 				thread = await message.create_thread(
-					name=f" WYR Discussion - {chicago_now.strftime('%m/%d')}",
+					name=_discussion_thread_name(),
 					auto_archive_duration=1440
 				)
 
@@ -406,44 +508,33 @@ class WYR(commands.Cog):
 
 	async def update_user_leaderboard(self, user_id, option_chosen):
 		"""
-		Update user statistics in the WYR_Leaderboard collection using the new DatabaseManager.
+		Queue a user statistics update for the WYR_Leaderboard collection.
+		The update is written by the next leaderboard flush.
 		"""
 		try:
-			with PerformanceLogger(logger, f"update_user_leaderboard_{user_id}"):
-				user_id_str = str(user_id)
+			now = datetime.now(timezone.utc)
 
-				# Check if user exists in leaderboard
-				user_stats = await db_manager.daily_wyr_leaderboard.find_one({"user_id": user_id_str})
-
-				if not user_stats:
-					# Create new user entry
-					new_user = {
-						"user_id": user_id_str,
+			# Single upsert: new users get their entry created server-side, existing ones are incremented
+			self._leaderboard_queue.append(UpdateOne(
+				{"user_id": str(user_id)},
+				{
+					"$inc": {
 						"total_votes": 1,
-						"option1_votes": 1 if option_chosen == "option1" else 0,
-						"option2_votes": 1 if option_chosen == "option2" else 0,
-						"last_vote": datetime.now(timezone.utc),
-						"first_vote": datetime.now(timezone.utc)
-					}
-					await db_manager.daily_wyr_leaderboard.create_one(new_user)
-					logger.info(f"Created new leaderboard entry for user {user_id}: {option_chosen}")
-				else:
-					# Update existing user
-					update_query = {
-						"$inc": {
-							"total_votes": 1,
-							f"{option_chosen}_votes": 1
-						},
-						"$set": {
-							"last_vote": datetime.now(timezone.utc)
-						}
+						f"{option_chosen}_votes": 1
+					},
+					"$set": {
+						"last_vote": now,
+						"updated_at": now
+					},
+					"$setOnInsert": {
+						"first_vote": now,
+						"created_at": now
 					}
-					await db_manager.daily_wyr_leaderboard.update_one(
-						{"user_id": user_id_str},
-						update_query
-					)
-					logger.info(
-						f"Updated leaderboard for user {user_id}: {option_chosen} (total: {user_stats.get('total_votes', 0) + 1})")
+				},
+				upsert=True
+			))
+			self._trim_leaderboard_queue()
+			logger.info(f"Queued leaderboard update for user {user_id}: {option_chosen}")
 
 		except Exception as e:
 			logger.error(f"Error updating user leaderboard for {user_id}: {e}", exc_info=True)
@@ -461,6 +552,7 @@ class WYR(commands.Cog):
 				# Use the new database manager to find questions
 				questions = await db_manager.daily_wyr.find_many(
 					filter_dict=query,
+					projection=QUESTION_PROJECTION,
 					sort=[("used_count", 1)],
 					limit=1
 				)
@@ -484,13 +576,21 @@ class WYR(commands.Cog):
 		"""
 		try:
 			with PerformanceLogger(logger, f"get_random_question_{category}"):
-				pipeline = [
-					{"$match": {"tags": category}},
-					{"$sample": {"size": 1}}
-				]
-
-				# Use the new database manager for aggregation
-				questions = await db_manager.daily_wyr.aggregate(pipeline)
+				# Skip to a random offset within the (cached) category size instead of a $sample aggregation
+				questions = []
+				for refresh in (False, True):
+					count = await self.get_question_count(category, refresh=refresh)
+					if not count:
+						continue
+					questions = await db_manager.daily_wyr.find_many(
+						filter_dict={"tags": category},
+						projection=QUESTION_PROJECTION,
+						skip=random.randrange(count),
+						limit=1
+					)
+					if questions:
+						break
+					# The cached count was stale; recount once and retry
 
 				if questions:
 					question = questions[0]
@@ -504,6 +604,36 @@ class WYR(commands.Cog):
 			logger.error(f"Error fetching random WYR question ({category}): {e}", exc_info=True)
 			return None
 
+	async def get_question_count(self, category, refresh=False):
+		"""
+		Number of questions tagged with a category, cached for QUESTION_COUNT_TTL seconds.
+		"""
+		cached = self._question_counts.get(category)
+		now = time.monotonic()
+		if cached and not refresh and now < cached[0]:
+			return cached[1]
+
+		count = await db_manager.daily_wyr.count_documents({"tags": category})
+		self._question_counts[category] = (now + QUESTION_COUNT_TTL, count)
+		return count
+
+	async def resolve_user(self, user_id):
+		"""
+		Look a user up in the bot's cache, falling back to a REST fetch cached for USER_FETCH_TTL seconds.
+		"""
+		user = self.bot.get_user(user_id)
+		if user is not None:
+			return user
+
+		now = time.monotonic()
+		cached = self._fetched_users.get(user_id)
+		if cached and now < cached[0]:
+			return cached[1]
+
+		user = await self.bot.fetch_user(user_id)
+		self._fetched_users[user_id] = (now + USER_FETCH_TTL, user)
+		return user
+
 	async def get_user_stats(self, user_id):
 		"""
 		Get user voting statistics from the leaderboard collection using the new DatabaseManager.
@@ -513,7 +643,10 @@ class WYR(commands.Cog):
 		try:
 			with PerformanceLogger(logger, f"get_user_stats_{user_id}"):
 				# Use the new database manager to find user stats
-				user_stats = await db_manager.daily_wyr_leaderboard.find_one({"user_id": str(user_id)})
+				user_stats = await db_manager.daily_wyr_leaderboard.find_one(
+					{"user_id": str(user_id)},
+					{"option1_votes": 1, "option2_votes": 1, "total_votes": 1, "first_vote": 1, "last_vote": 1}
+				)
 
 				if not user_stats:
 					logger.info(f"No stats found for user {user_id}")
@@ -540,30 +673,31 @@ class WYR(commands.Cog):
 		"""
 		try:
 			with PerformanceLogger(logger, f"record_vote_{user_id}_{option}"):
-				# Check if user has already voted to handle vote count properly
-				existing_question = await db_manager.daily_wyr.find_one({"_id": question_id})
-				if not existing_question:
-					logger.error(f"Question {question_id} not found for vote recording")
-					return
-
-				existing_votes = existing_question.get("votes", {})
-				previous_vote = existing_votes.get(str(user_id))
-
-				update_query = {"$set": {f"votes.{user_id}": option}}
+				# Each vote is its own small document keyed by (question_id, user_id); the atomic upsert
+				# hands back the user's previous choice, so concurrent clicks can't double count
+				previous = await db_manager.daily_wyr_votes.find_one_and_update(
+					{"question_id": question_id, "user_id": str(user_id)},
+					{"$set": {"option": option}},
+					projection={"option": 1},
+					upsert=True
+				)
+				previous_vote = previous.get("option") if previous else None
+				if not previous:
+					# Questions posted before WYR_Votes existed still carry their votes in the votes.<user_id> map
+					legacy = await db_manager.daily_wyr.find_one({"_id": question_id}, {f"votes.{user_id}": 1})
+					if legacy:
+						previous_vote = legacy.get("votes", {}).get(str(user_id))
 				is_new_vote = not previous_vote
 
-				# If this is a new vote, increment the chosen option
-				if is_new_vote:
-					update_query["$inc"] = {f"vote_counts.{option}": 1}
-				# If changing vote, decrement old option and increment new option
-				elif previous_vote != option:
-					update_query["$inc"] = {
-						f"vote_counts.{previous_vote}": -1,
-						f"vote_counts.{option}": 1
-					}
-
-				# Use the new database manager to update the question
-				await db_manager.daily_wyr.update_one({"_id": question_id}, update_query)
+				if previous_vote != option:
+					vote_counts = {f"vote_counts.{option}": 1}
+					if previous_vote:
+						vote_counts[f"vote_counts.{previous_vote}"] = -1
+					if not await db_manager.daily_wyr.update_one({"_id": question_id}, {"$inc": vote_counts}):
+						logger.error(f"Question {question_id} not found for vote recording")
+						return
+					# Let the voter see their own vote in the results straight away
+					self._results_cache.pop(question_id, None)
 
 				# Only update leaderboard for new votes (not vote changes)
 				if is_new_vote:
@@ -580,10 +714,14 @@ class WYR(commands.Cog):
 		"""
 		Get voting results for a specific question using the new DatabaseManager.
 		"""
+		cached = self._results_cache.get(question_id)
+		if cached and cached[0] > time.monotonic():
+			return cached[1]
+
 		try:
 			with PerformanceLogger(logger, f"get_question_results_{question_id}"):
 				# Use the new database manager to find the question
-				question = await db_manager.daily_wyr.find_one({"_id": question_id})
+				question = await db_manager.daily_wyr.find_one({"_id": question_id}, {"vote_counts": 1})
 				if not question:
 					logger.warning(f"Question {question_id} not found for results")
 					return None
@@ -605,6 +743,7 @@ class WYR(commands.Cog):
 					"total_votes": total_votes
 				}
 
+				self._results_cache[question_id] = (time.monotonic() + RESULTS_CACHE_TTL, results)
 				logger.info(f"Retrieved results for question {question_id}: {total_votes} total votes")
 				return results
 
@@ -636,14 +775,27 @@ class WYR(commands.Cog):
 		Create a Discord embed for the WYR question.
 		"""
 		try:
-			embed = discord.Embed(
-				title="❓ Would You Rather...",
-				description=(
-					f"{OPTION1_EMOJI} **{question['option1']}**\n"
-					f"{OPTION2_EMOJI} **{question['option2']}**"
-				),
-				color=discord.Color.blue()
-			)
+			question_id = question.get('_id')
+			base = self._embed_cache.get(question_id) if question_id is not None else None
+			if base is None:
+				base = discord.Embed(
+					title="❓ Would You Rather...",
+					description=(
+						f"{OPTION1_EMOJI} **{question['option1']}**\n"
+						f"{OPTION2_EMOJI} **{question['option2']}**"
+					),
+					color=discord.Color.blue()
+				)
+				base.set_footer(text="Click a button to vote! • Results update in real-time")
+				if question_id is not None:
+					self._embed_cache[question_id] = base
+					if len(self._embed_cache) > EMBED_CACHE_SIZE:
+						self._embed_cache.popitem(last=False)
+			else:
+				self._embed_cache.move_to_end(question_id)
+
+			# Embed.copy gives the caller its own fields list, so the cached base stays untouched
+			embed = base.copy()
 
 			if show_results and results:
 				embed.add_field(
@@ -658,7 +810,6 @@ class WYR(commands.Cog):
 					inline=False
 				)
 
-			embed.set_footer(text="Click a button to vote! • Results update in real-time")
 			logger.debug(f"Created embed for question {question.get('_id', 'unknown')}")
 			return embed
 
@@ -672,29 +823,102 @@ class WYR(commands.Cog):
 			)
 
 
+# action -> (label, style, emoji) for the buttons under a posted question
+_BUTTON_STYLES = {
+	"option1": ("Option 1", discord.ButtonStyle.primary, OPTION1_EMOJI),
+	"option2": ("Option 2", discord.ButtonStyle.primary, OPTION2_EMOJI),
+	"results": ("Show Results", discord.ButtonStyle.secondary, ""),
+}
+
+
+# custom_id of a WYRButton: the action and the id of the question it belongs to
+_BUTTON_ID_PATTERN = re.compile(r"wyr:(?P<action>option1|option2|results):(?P<question_id>.+)")
+
+
+def _parse_question_id(raw):
+	"""Turn the question id carried in a button custom_id back into its database type."""
+	if ObjectId.is_valid(raw):
+		return ObjectId(raw)
+	return int(raw) if raw.isdigit() else raw
+
+
+def _question_id_from_message(message: discord.Message):
+	"""Recover the question id from the WYRButton custom_ids on a posted question, or None."""
+	for row in message.components:
+		for component in getattr(row, "children", ()):
+			match = _BUTTON_ID_PATTERN.fullmatch(getattr(component, "custom_id", None) or "")
+			if match:
+				return _parse_question_id(match["question_id"])
+	return None
+
+
+def _build_results_embed(results):
+	"""Results embed with a progress bar per option."""
+	embed = discord.Embed(
+		title=" Current Results",
+		color=discord.Color.green()
+	)
+
+	# Visual progress bars from the precomputed table
+	bar1 = _BAR_TABLE[min(BAR_LENGTH, int(results['option1_percentage'] * BAR_LENGTH / 100))]
+	bar2 = _BAR_TABLE[min(BAR_LENGTH, int(results['option2_percentage'] * BAR_LENGTH / 100))]
+
+	embed.add_field(
+		name=f"{OPTION1_EMOJI} Option 1",
+		value=f"{bar1} {results['option1_percentage']:.1f}% ({results['option1_votes']} votes)",
+		inline=False
+	)
+	embed.add_field(
+		name=f"{OPTION2_EMOJI} Option 2",
+		value=f"{bar2} {results['option2_percentage']:.1f}% ({results['option2_votes']} votes)",
+		inline=False
+	)
+	embed.add_field(
+		name=" Total Votes",
+		value=f"{results['total_votes']} people have voted",
+		inline=False
+	)
+	return embed
+
+
 class WYRView(discord.ui.View):
+	"""
+	The buttons for one posted question. Every button is a WYRButton, so the bot's view
+	store keeps only the shared dynamic item pattern rather than one view per question.
+	"""
+
 	def __init__(self, question_id, cog):
 		super().__init__(timeout=None)  # Persistent view
+		for action in _BUTTON_STYLES:
+			self.add_item(WYRButton(action, question_id, cog))
+		logger.debug(f"Created WYRView for question {question_id}")
+
+
+class WYRButton(discord.ui.DynamicItem[discord.ui.Button], template=_BUTTON_ID_PATTERN):
+	"""A vote or results button whose question id is carried in its custom_id."""
+
+	def __init__(self, action, question_id, cog):
+		label, style, emoji = _BUTTON_STYLES[action]
+		super().__init__(
+			discord.ui.Button(label=label, style=style, emoji=emoji, custom_id=f"wyr:{action}:{question_id}")
+		)
+		self.action = action
 		self.question_id = question_id
 		self.cog = cog
-		logger.debug(f"Created WYRView for question {question_id}")
 
-	@discord.ui.button(label="Option 1", style=discord.ButtonStyle.primary, emoji=OPTION1_EMOJI)
-	async def option1_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-		logger.info(
-			f"Option 1 vote button clicked by {interaction.user} (ID: {interaction.user.id}) for question {self.question_id}")
-		await self.handle_vote(interaction, "option1")
+	@classmethod
+	async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+		return cls(match["action"], _parse_question_id(match["question_id"]), interaction.client.get_cog("WYR"))
 
-	@discord.ui.button(label="Option 2", style=discord.ButtonStyle.primary, emoji=OPTION2_EMOJI)
-	async def option2_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+	async def callback(self, interaction: discord.Interaction):
 		logger.info(
-			f"Option 2 vote button clicked by {interaction.user} (ID: {interaction.user.id}) for question {self.question_id}")
-		await self.handle_vote(interaction, "option2")
+			f"{_BUTTON_STYLES[self.action][0]} button clicked by {interaction.user} (ID: {interaction.user.id}) for question {self.question_id}")
+		if self.action == "results":
+			await self.show_results(interaction)
+		else:
+			await self.handle_vote(interaction, self.action)
 
-	@discord.ui.button(label="Show Results", style=discord.ButtonStyle.secondary, emoji="")
-	async def show_results_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-		logger.info(
-			f"Show results button clicked by {interaction.user} (ID: {interaction.user.id}) for question {self.question_id}")
+	async def show_results(self, interaction: discord.Interaction):
 
 		try:
 			with PerformanceLogger(logger, f"show_results_{self.question_id}"):
@@ -704,36 +928,7 @@ class WYRView(discord.ui.View):
 					await interaction.response.send_message("❌ Could not fetch results.", ephemeral=True)
 					return
 
-				embed = discord.Embed(
-					title=" Current Results",
-					color=discord.Color.green()
-				)
-
-				# Create visual progress bars
-				def create_bar(percentage, length=20):
-					filled = int(percentage / 100 * length)
-					return "█" * filled + "░" * (length - filled)
-
-				bar1 = create_bar(results['option1_percentage'])
-				bar2 = create_bar(results['option2_percentage'])
-
-				embed.add_field(
-					name=f"{OPTION1_EMOJI} Option 1",
-					value=f"{bar1} {results['option1_percentage']:.1f}% ({results['option1_votes']} votes)",
-					inline=False
-				)
-				embed.add_field(
-					name=f"{OPTION2_EMOJI} Option 2",
-					value=f"{bar2} {results['option2_percentage']:.1f}% ({results['option2_votes']} votes)",
-					inline=False
-				)
-				embed.add_field(
-					name=" Total Votes",
-					value=f"{results['total_votes']} people have voted",
-					inline=False
-				)
-
-				await interaction.response.send_message(embed=embed, ephemeral=True)
+				await interaction.response.send_message(embed=_build_results_embed(results), ephemeral=True)
 				logger.info(f"Successfully showed results for question {self.question_id} to {interaction.user}")
 
 		except Exception as e:
@@ -743,6 +938,8 @@ class WYRView(discord.ui.View):
 	async def handle_vote(self, interaction: discord.Interaction, option):
 		try:
 			with PerformanceLogger(logger, f"handle_vote_{option}"):
+				# Acknowledge first so a slow database write can't run past Discord's 3 second window
+				await interaction.response.defer(ephemeral=True)
 				await self.cog.record_vote(self.question_id, interaction.user.id, option)
 
 				option_text = "Option 1" if option == "option1" else "Option 2"
@@ -753,16 +950,14 @@ class WYRView(discord.ui.View):
 				)
 				embed.set_footer(text="Your vote has been saved • You can change your vote anytime")
 
-				await interaction.response.send_message(embed=embed, ephemeral=True)
+				await interaction.followup.send(embed=embed, ephemeral=True)
 				logger.info(f"Vote successfully processed for {interaction.user} (ID: {interaction.user.id}): {option}")
 
 		except Exception as e:
 			logger.error(f"Error handling vote from {interaction.user} (ID: {interaction.user.id}): {e}", exc_info=True)
 			try:
-				await interaction.response.send_message(
-					"❌ There was an error recording your vote. Please try again.",
-					ephemeral=True
-				)
+				send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+				await send("❌ There was an error recording your vote. Please try again.", ephemeral=True)
 			except:
 				logger.error(f"Failed to send error message to {interaction.user}")
 
@@ -23,6 +23,112 @@ logging.basicConfig(
 )
 logger = logging.getLogger('healthcheck')
 
+PROC_DIR = '/proc'
+# Each probe is a new process, so the main bot PID found by a full scan is remembered here
+MAIN_PID_FILE = '/tmp/codex_healthcheck_main.pid'
+# Touched after each successful log directory write probe; its mtime outlives the probe process
+WRITE_PROBE_STAMP = '/tmp/codex_healthcheck_write_probe'
+# Seconds a successful write probe of the log directory is trusted
+WRITE_PROBE_INTERVAL = 300
+
+
+def _read_proc_file(pid, name):
+	"""Read /proc/<pid>/<name>, returning None if the process is gone or unreadable."""
+	try:
+		with open(f"{PROC_DIR}/{pid}/{name}", 'rb') as f:
+			return f.read()
+	except OSError:
+		return None
+
+
+def _load_main_pid():
+	"""Return the main bot PID remembered by an earlier probe, or None."""
+	try:
+		with open(MAIN_PID_FILE) as f:
+			return int(f.read().strip())
+	except (OSError, ValueError):
+		return None
+
+
+def _save_main_pid(pid):
+	try:
+		with open(MAIN_PID_FILE, 'w') as f:
+			f.write(str(pid))
+	except OSError as e:
+		logger.warning(f"Could not remember main bot PID: {e}")
+
+
+def _write_probe_age():
+	"""Seconds since an earlier probe last wrote to the log directory, or None."""
+	try:
+		return time.time() - os.stat(WRITE_PROBE_STAMP).st_mtime
+	except OSError:
+		return None
+
+
+def _stamp_write_probe():
+	try:
+		Path(WRITE_PROBE_STAMP).touch()
+	except OSError as e:
+		logger.warning(f"Could not record log directory write probe: {e}")
+
+
+def _scan_python_procs():
+	"""
+	List running python processes as dicts with pid, name, cmdline, cwd and rss (bytes).
+	On Linux this reads /proc directly, touching cmdline/cwd/statm only for python processes;
+	elsewhere it falls back to psutil.
+	"""
+	if not os.path.isdir(PROC_DIR):
+		procs = []
+		# Only pid and name for every process; the other fields are read just for python hits
+		for proc in psutil.process_iter(['pid', 'name']):
+			name = proc.info['name']
+			if not name or 'python' not in name.lower():
+				continue
+			try:
+				info = proc.as_dict(['cmdline', 'cwd', 'memory_info'])
+			except (psutil.NoSuchProcess, psutil.ZombieProcess):
+				continue
+			memory_info = info['memory_info']
+			procs.append({
+				'pid': proc.info['pid'],
+				'name': name,
+				'cmdline': ' '.join(info['cmdline']) if info['cmdline'] else '',
+				'cwd': info['cwd'],
+				'rss': memory_info.rss if memory_info else 0
+			})
+		return procs
+
+	page_size = os.sysconf('SC_PAGE_SIZE')
+	procs = []
+	for entry in os.listdir(PROC_DIR):
+		if not entry.isdigit():
+			continue
+
+		comm = _read_proc_file(entry, 'comm')
+		if not comm:
+			continue
+		name = comm.decode(errors='replace').strip()
+		if 'python' not in name.lower():
+			continue
+
+		cmdline = _read_proc_file(entry, 'cmdline') or b''
+		statm = _read_proc_file(entry, 'statm')
+		try:
+			cwd = os.readlink(f"{PROC_DIR}/{entry}/cwd")
+		except OSError:
+			cwd = None
+
+		procs.append({
+			'pid': int(entry),
+			'name': name,
+			'cmdline': cmdline.replace(b'\0', b' ').decode(errors='replace').strip(),
+			'cwd': cwd,
+			# statm is "size resident shared ..." in pages
+			'rss': int(statm.split()[1]) * page_size if statm else 0
+		})
+	return procs
 
 
 class HealthChecker:
@@ -30,6 +136,10 @@ class HealthChecker:
 
 	def __init__(self):
 		self.max_check_time = 8.0
+		# Process scan shared by the checks of one run_health_check
+		self._proc_cache = None
+		# PID of the codex.py process, reused while it is still alive
+		self._main_pid = _load_main_pid()
 
 	# Log environment info for debugging
 	logger.info(f"Health check starting in PID {os.getpid()}")
@@ -43,37 +153,53 @@ class HealthChecker:
 	else:
 		logger.warning("Not running inside Docker container")
 
+	def _get_python_procs(self):
+		"""Return the python process scan, running it at most once per health check."""
+		if self._proc_cache is None:
+			self._proc_cache = _scan_python_procs()
+		return self._proc_cache
+
+	def _main_pid_alive(self):
+		"""True if the remembered main PID still belongs to a codex.py process."""
+		if self._main_pid is None:
+			return False
+		cmdline = _read_proc_file(self._main_pid, 'cmdline')
+		if cmdline and b'codex.py' in cmdline:
+			return True
+		self._main_pid = None
+		return False
+
 	def check_main_process(self):
 		"""Check if the main bot process is running."""
 		try:
+			# Reading one cmdline is enough while the remembered process is still running
+			if self._main_pid_alive():
+				logger.info(f"Main bot process still running: PID {self._main_pid}")
+				return True
+
 			# Look for python processes running codex.py or any python process in /app
 			main_process_found = False
 			python_processes = []
 
-			for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
-				try:
-					# Skip if not a python process
-					if not proc.info['name'] or 'python' not in proc.info['name'].lower():
-						continue
-
-					cmdline_str = ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else ''
-					python_processes.append({
-						'pid': proc.info['pid'],
-						'cmdline': cmdline_str,
-						'cwd': proc.info.get('cwd', 'N/A')
-					})
-
-					# Check for codex.py specifically
-					if 'codex.py' in cmdline_str:
-						logger.info(f"Found main bot process: PID {proc.info['pid']} - {cmdline_str}")
-						main_process_found = True
-					# Also accept any python process running from /app directory
-					elif '/app' in cmdline_str or (proc.info.get('cwd') and '/app' in proc.info['cwd']):
-						logger.info(f"Found potential bot process: PID {proc.info['pid']} - {cmdline_str}")
-						main_process_found = True
-
-				except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-					continue
+			for proc in self._get_python_procs():
+				cmdline_str = proc['cmdline']
+				python_processes.append({
+					'pid': proc['pid'],
+					'cmdline': cmdline_str,
+					'cwd': proc['cwd']
+				})
+
+				# Check for codex.py specifically
+				if 'codex.py' in cmdline_str:
+					logger.info(f"Found main bot process: PID {proc['pid']} - {cmdline_str}")
+					main_process_found = True
+					if self._main_pid != proc['pid']:
+						self._main_pid = proc['pid']
+						_save_main_pid(proc['pid'])
+				# Also accept any python process running from /app directory
+				elif '/app' in cmdline_str or (proc['cwd'] and '/app' in proc['cwd']):
+					logger.info(f"Found potential bot process: PID {proc['pid']} - {cmdline_str}")
+					main_process_found = True
 
 			# Log all python processes for debugging
 			if python_processes:
@@ -99,10 +225,19 @@ class HealthChecker:
 			if not log_dir.exists():
 				log_dir.mkdir(parents=True, exist_ok=True)
 
+			# Permission bits are enough between real write probes
+			if not os.access(log_dir, os.W_OK | os.X_OK):
+				logger.error("Log directory is not writable")
+				return False
+			probe_age = _write_probe_age()
+			if probe_age is not None and 0 <= probe_age < WRITE_PROBE_INTERVAL:
+				return True
+
 			# Test write access
 			test_file = log_dir / "healthcheck_test"
 			test_file.write_text("health_check")
 			test_file.unlink()
+			_stamp_write_probe()
 
 			return True
 		except Exception as e:
@@ -119,10 +254,14 @@ class HealthChecker:
 			# Look for recent log files (within last 5 minutes)
 			recent_threshold = time.time() - 300  # 5 minutes
 
-			for log_file in log_dir.glob("*.log"):
-				if log_file.stat().st_mtime > recent_threshold:
+			# One scandir pass, one stat per log file
+			with os.scandir(log_dir) as entries:
+				for entry in entries:
+					if not entry.name.endswith('.log') or not entry.is_file():
+						continue
+					st = entry.stat()
 					# Check if file has recent content
-					if log_file.stat().st_size > 0:
+					if st.st_mtime > recent_threshold and st.st_size > 0:
 						return True
 
 			logger.warning("No recent log activity found")
@@ -135,20 +274,22 @@ class HealthChecker:
 	def check_memory_usage(self):
 		"""Check memory usage of the container."""
 		try:
-			# Get memory info for all python processes
-			total_memory_mb = 0
-			process_count = 0
-
-			for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
-				try:
-					if proc.info['name'] == 'python':
-						memory_mb = proc.info['memory_info'].rss / 1024 / 1024
-						total_memory_mb += memory_mb
+			statm = _read_proc_file(self._main_pid, 'statm') if self._main_pid_alive() else None
+			if statm:
+				# Known main process: its own statm is all that needs reading
+				total_memory_mb = int(statm.split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+				logger.info(f"Main bot process PID {self._main_pid}, memory: {total_memory_mb:.1f}MB")
+			else:
+				# Get memory info for all python processes
+				total_memory_mb = 0
+				process_count = 0
+
+				for proc in self._get_python_procs():
+					if proc['name'] == 'python':
+						total_memory_mb += proc['rss'] / 1024 / 1024
 						process_count += 1
-				except (psutil.NoSuchProcess, psutil.AccessDenied):
-					continue
 
-			logger.info(f"Python processes: {process_count}, Total memory: {total_memory_mb:.1f}MB")
+				logger.info(f"Python processes: {process_count}, Total memory: {total_memory_mb:.1f}MB")
 
 			# Alert if memory usage is above 500MB
 			if total_memory_mb > 500:
@@ -165,7 +306,7 @@ class HealthChecker:
 		try:
 			response = requests.get(
 				"https://discord.com/api/v10/gateway",
-				timeout=5
+				timeout=3
 			)
 
 			if response.status_code == 200:
@@ -181,6 +322,7 @@ class HealthChecker:
 	def run_health_check(self):
 		"""Run comprehensive health check."""
 		start_time = time.time()
+		self._proc_cache = None
 
 		try:
 			checks_passed = 0
@@ -1,14 +1,16 @@
 # python
 import os
-import asyncio
+import logging
+import time
 from datetime import datetime, timezone
 from typing import Dict, Optional, List
 
 import discord
 from discord.ext import commands
+from pymongo import ReturnDocument
 
 from utils.logger import get_logger, PerformanceLogger, log_context
-from Database.DatabaseManager import db_manager
+from Database.DatabaseManager import db_manager, with_retry
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,6 +18,35 @@ load_dotenv()
 logger = get_logger("UpdatesDrops.DropsStatsCog")
 
 
+def _totals_pipeline(months_inc: int) -> List[dict]:
+	"""Totals update: increment the counters, then derive the average from the new values."""
+	return [
+		{"$set": {
+			"total_count": {"$add": [{"$ifNull": ["$total_count", 0]}, 1]},
+			"months_with_data": {"$add": [{"$ifNull": ["$months_with_data", 0]}, months_inc]},
+		}},
+		{"$set": {
+			"average_per_month": {"$cond": [
+				{"$gt": ["$months_with_data", 0]},
+				{"$round": [{"$divide": ["$total_count", "$months_with_data"]}, 2]},
+				0.0
+			]},
+		}},
+	]
+
+
+# The totals update has no per-event values, so both variants are built once. They are never
+# mutated (CollectionManager appends its updated_at stage to a copy), so concurrent events can share them.
+_TOTALS_PIPELINES = {False: _totals_pipeline(0), True: _totals_pipeline(1)}
+
+
+def _normalize_embed_list(embeds: List[discord.Embed]) -> List[dict]:
+	"""
+    Convert embed objects to plain dicts for stable comparison.
+    """
+	return [e.to_dict() for e in embeds]
+
+
 class DropsStatsCog(commands.Cog):
 	"""
     Discord Cog that:
@@ -33,10 +64,12 @@ class DropsStatsCog(commands.Cog):
 			1317187274496016494: "Free",  # Free games
 			1316889374318923856: "Prime",  # Prime drops
 		}
-		logger.debug(f"Initialized channel map with {len(self.channel_map)} entries: {list(self.channel_map.items())}")
+		# Membership test for the hot path; on_message fires for every message the bot can see
+		self._tracked_ids = frozenset(self.channel_map)
 
-		# Simple lock to serialize writes if desired (Mongo ops are atomic, but this can reduce interleaving)
-		self._op_lock = asyncio.Lock()
+		# (epoch second, aware datetime) shared by all events within the same second
+		self._now_cache = (0, None)
+		logger.debug("Initialized channel map with %d entries: %s", len(self.channel_map), list(self.channel_map.items()))
 
 		logger.info("DropsStatsCog created using DatabaseManager")
 
@@ -59,56 +92,52 @@ class DropsStatsCog(commands.Cog):
 				# Initialize the global database manager
 				await db_manager.initialize()
 
-				# Test connectivity by checking collection health
-				monthly_manager = db_manager.get_collection_manager('updates_monthly')
-				totals_manager = db_manager.get_collection_manager('updates_totals')
-
-				# Simple connectivity test
-				await monthly_manager.count_documents({})
-				await totals_manager.count_documents({})
+				# Simple connectivity test; a ping doesn't scan the stats collections like count_documents did
+				await self._ping_database()
 
 				logger.info("DatabaseManager initialized successfully for DropsStatsCog")
 			except Exception as e:
 				logger.error("Database initialization failed: %s", e, exc_info=True)
 				raise
 
+	@staticmethod
+	@with_retry(max_retries=3, backoff_factor=0.5)
+	async def _ping_database():
+		"""Ping the primary connection, retrying transient failures with a short backoff."""
+		await db_manager.get_client().admin.command("ping")
+
 	# ---------------------------
 	# Helpers
 	# ---------------------------
-	@staticmethod
-	def _normalize_embed_list(embeds: List[discord.Embed]) -> List[dict]:
+	def _cached_now(self) -> datetime:
 		"""
-        Convert embed objects to plain dicts for stable comparison.
+        Current UTC time at one-second resolution; burst events within a second share one datetime.
         """
-		try:
-			return [e.to_dict() for e in embeds or []]
-		except Exception:
-			# Fallback: basic fields if to_dict is unavailable for any reason
-			norm = []
-			for e in embeds or []:
-				norm.append({
-					"title": getattr(e, "title", None),
-					"description": getattr(e, "description", None),
-					"color": getattr(e.color, "value", None) if getattr(e, "color", None) else None,
-					"footer": getattr(getattr(e, "footer", None), "text", None),
-					"thumbnail": getattr(getattr(e, "thumbnail", None), "url", None),
-					"image": getattr(getattr(e, "image", None), "url", None),
-					"author": getattr(getattr(e, "author", None), "name", None),
-					"fields": [
-						{"name": f.name, "value": f.value, "inline": f.inline}
-						for f in getattr(e, "fields", []) or []
-					],
-				})
-			logger.debug("Embeds normalized via fallback path; count=%d", len(norm))
-			return norm
-
-	@classmethod
-	def _embeds_changed(cls, before: List[discord.Embed], after: List[discord.Embed]) -> bool:
+		second = int(time.time())
+		if self._now_cache[0] != second:
+			self._now_cache = (second, datetime.fromtimestamp(second, tz=timezone.utc))
+		return self._now_cache[1]
+
+	@staticmethod
+	def _embeds_changed(before: List[discord.Embed], after: List[discord.Embed]) -> bool:
 		"""
         Determine if embeds changed meaningfully between before and after.
         """
-		b = cls._normalize_embed_list(before)
-		a = cls._normalize_embed_list(after)
+		# A different embed count is always a change, and two empty lists never are; neither needs normalizing
+		if len(before) != len(after):
+			logger.debug("Embeds changed=True (before_count=%d, after_count=%d)", len(before), len(after))
+			return True
+		if not after:
+			return False
+
+		# Cheap attribute checks catch most real changes before any dict is built
+		for old, new in zip(before, after):
+			if old.title != new.title or old.url != new.url or old.description != new.description:
+				logger.debug("Embeds changed=True (title/url/description differ)")
+				return True
+
+		b = _normalize_embed_list(before)
+		a = _normalize_embed_list(after)
 		changed = b != a
 		logger.debug("Embeds changed=%s (before_count=%d, after_count=%d)", changed, len(b), len(a))
 		return changed
@@ -127,13 +156,14 @@ class DropsStatsCog(commands.Cog):
 			logger.debug("on_message ignored: message %s is from DM", getattr(message, "id", "unknown"))
 			return
 
-		coll_name = self.channel_map.get(message.channel.id)
-		if not coll_name:
-			logger.debug(
-				"on_message ignored: channel %s (#%s) not in channel_map",
-				message.channel.id, getattr(message.channel, "name", "unknown")
-			)
+		if message.channel.id not in self._tracked_ids:
+			if logger.isEnabledFor(logging.DEBUG):
+				logger.debug(
+					"on_message ignored: channel %s (#%s) not in channel_map",
+					message.channel.id, getattr(message.channel, "name", "unknown")
+				)
 			return
+		coll_name = self.channel_map[message.channel.id]
 
 		# Detect webhook messages
 		is_webhook = message.webhook_id is not None
@@ -157,20 +187,15 @@ class DropsStatsCog(commands.Cog):
 				len(getattr(message, "content", "") or "")
 			)
 
-			# Perform DB updates
-			logger.debug("Attempting to acquire operation lock for message %s...", message.id)
-			async with self._op_lock:
-				logger.debug("Operation lock acquired for message %s", message.id)
-				try:
-					await self._process_event_async(coll_name, event_dt)
-					logger.debug("Message %s processed successfully for '%s'", message.id, coll_name)
-				except Exception as e:
-					logger.error(
-						"Failed processing message %s in channel %s: %s",
-						message.id, message.channel.id, e, exc_info=True
-					)
-				finally:
-					logger.debug("Releasing operation lock for message %s", message.id)
+			# Perform DB updates; each write is atomic server-side, so events run concurrently
+			try:
+				await self._process_event_async(coll_name, event_dt)
+				logger.debug("Message %s processed successfully for '%s'", message.id, coll_name)
+			except Exception as e:
+				logger.error(
+					"Failed processing message %s in channel %s: %s",
+					message.id, message.channel.id, e, exc_info=True
+				)
 
 	@commands.Cog.listener("on_message_edit")
 	async def handle_message_edit(self, before: discord.Message, after: discord.Message):
@@ -183,13 +208,14 @@ class DropsStatsCog(commands.Cog):
 			logger.debug("on_message_edit ignored: message %s is from DM", getattr(after, "id", "unknown"))
 			return
 
-		coll_name = self.channel_map.get(after.channel.id)
-		if not coll_name:
-			logger.debug(
-				"on_message_edit ignored: channel %s (#%s) not in channel_map",
-				after.channel.id, getattr(after.channel, "name", "unknown")
-			)
+		if after.channel.id not in self._tracked_ids:
+			if logger.isEnabledFor(logging.DEBUG):
+				logger.debug(
+					"on_message_edit ignored: channel %s (#%s) not in channel_map",
+					after.channel.id, getattr(after.channel, "name", "unknown")
+				)
 			return
+		coll_name = self.channel_map[after.channel.id]
 
 		# Only count when embeds changed meaningfully (added/modified/removed->added)
 		if not self._embeds_changed(before.embeds or [], after.embeds or []):
@@ -213,19 +239,14 @@ class DropsStatsCog(commands.Cog):
 				len(before.embeds or []), len(after.embeds or [])
 			)
 
-			logger.debug("Attempting to acquire operation lock for edit %s...", after.id)
-			async with self._op_lock:
-				logger.debug("Operation lock acquired for edit %s", after.id)
-				try:
-					await self._process_event_async(coll_name, event_dt)
-					logger.debug("Edit for message %s processed successfully for '%s'", after.id, coll_name)
-				except Exception as e:
-					logger.error(
-						"Failed processing edit for message %s in channel %s: %s",
-						after.id, after.channel.id, e, exc_info=True
-					)
-				finally:
-					logger.debug("Releasing operation lock for edit %s", after.id)
+			try:
+				await self._process_event_async(coll_name, event_dt)
+				logger.debug("Edit for message %s processed successfully for '%s'", after.id, coll_name)
+			except Exception as e:
+				logger.error(
+					"Failed processing edit for message %s in channel %s: %s",
+					after.id, after.channel.id, e, exc_info=True
+				)
 
 	# ---------------------------
 	# Async DB logic using DatabaseManager
@@ -235,8 +256,8 @@ class DropsStatsCog(commands.Cog):
         For each message event:
           - Upsert monthly count doc and increment count.
           - If this is the first message for the month (doc was created), increment months_with_data.
-          - Increment total_count.
-          - Recompute and store average_per_month (rounded to 2 decimals).
+          - Increment total_count and recompute average_per_month (rounded to 2 decimals)
+            in one pipeline update, so the average never lags the counters.
         """
 		try:
 			logger.debug(
@@ -245,7 +266,7 @@ class DropsStatsCog(commands.Cog):
 			)
 			year = event_dt.year
 			month = event_dt.month
-			now = datetime.now(tz=timezone.utc)
+			now = self._cached_now()
 
 			# Get collection managers
 			monthly_manager = db_manager.get_collection_manager('updates_monthly')
@@ -255,66 +276,40 @@ class DropsStatsCog(commands.Cog):
 			logger.debug("Monthly doc _id=%s", monthly_id)
 
 			with PerformanceLogger(logger, f"monthly_increment::{coll_name}::{year}-{month:02d}"):
-				# Check if document exists before update to determine if it's a new month
-				existing_monthly = await monthly_manager.find_one({"_id": monthly_id})
-				new_month_started = existing_monthly is None
-
-				# Upsert monthly document
-				await monthly_manager.update_one(
+				# Upsert monthly document; the pre-image is None exactly when this event started the month
+				existing_monthly = await monthly_manager.find_one_and_update(
 					{"_id": monthly_id},
 					{
 						"$inc": {"count": 1},
 						"$setOnInsert": {"first_event_at": now},
 						"$set": {"updated_at": now},
 					},
+					projection={"_id": 1},
 					upsert=True
 				)
+				new_month_started = existing_monthly is None
 
 			logger.debug(
 				"Monthly stats update completed for %s (new_month=%s)",
 				monthly_id, new_month_started
 			)
 
-			# Build totals update
-			totals_inc = {"total_count": 1}
-			if new_month_started:
-				totals_inc["months_with_data"] = 1
-			logger.debug("Totals increment payload: %s", totals_inc)
+			logger.debug("Totals update: total_count +1, months_with_data +%d", int(new_month_started))
 
 			with PerformanceLogger(logger, f"totals_update::{coll_name}"):
-				await totals_manager.update_one(
+				totals_doc = await totals_manager.find_one_and_update(
 					{"_id": coll_name},
-					{
-						"$inc": totals_inc,
-						"$set": {"updated_at": now},
-					},
+					_TOTALS_PIPELINES[new_month_started],
+					projection={"total_count": 1, "months_with_data": 1, "average_per_month": 1},
+					return_document=ReturnDocument.AFTER,
 					upsert=True
 				)
 
-			logger.debug("Totals update completed for '%s'", coll_name)
-
-			# Fetch totals document to compute average
-			logger.debug("Fetching totals document for '%s' to compute average...", coll_name)
-			totals_doc = await totals_manager.find_one(
-				{"_id": coll_name},
-				projection={"total_count": 1, "months_with_data": 1}
-			)
-			logger.debug("Totals doc fetched: %s", totals_doc)
-
 			if totals_doc:
-				total = int(totals_doc.get("total_count", 0))
-				months = int(totals_doc.get("months_with_data", 0))
-				avg = round((total / months), 2) if months > 0 else 0.0
-				logger.debug("Computed average_per_month=%.2f from total=%d and months=%d", avg, total, months)
-
-				await totals_manager.update_one(
-					{"_id": coll_name},
-					{"$set": {"average_per_month": avg, "updated_at": now}}
-				)
-
 				logger.debug(
 					"Totals updated for %s: total=%d, months=%d, avg=%.2f",
-					coll_name, total, months, avg
+					coll_name, totals_doc.get("total_count", 0), totals_doc.get("months_with_data", 0),
+					totals_doc.get("average_per_month", 0.0)
 				)
 			else:
 				logger.warning("Totals document missing for %s after update", coll_name)
@@ -1,18 +1,106 @@
 import os
+import json
+import time
 import asyncio
+import hashlib
+import sqlite3
+import weakref
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Set
 from datetime import datetime, timezone, timedelta
+from zoneinfo import ZoneInfo
 import discord
-import pendulum
+from bson import encode
+from bson.raw_bson import RawBSONDocument
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
 import logging
-from pymongo import UpdateOne
-from collections import defaultdict
+from pymongo import IndexModel, ReplaceOne
+from pymongo.errors import BulkWriteError
+from collections import defaultdict, OrderedDict, Counter
+from itertools import islice
 
 from utils.logger import get_logger
 
 logger = get_logger("GuildCacheManager")
 
+# Timezone for stored timestamps, resolved once instead of on every clock read
+_CHICAGO = ZoneInfo("America/Chicago")
+
+# Schema version stamped on cached guild records
+CACHE_VERSION = "3.0"
+
+# Guilds above this member count refresh their collections one at a time instead of concurrently
+LARGE_GUILD_MEMBER_THRESHOLD = 10_000
+
+# Per-guild refresh interval bounds in seconds; the interval halves after a refresh where at least
+# REFRESH_BUSY_RATIO of the compared documents changed, doubles when under REFRESH_QUIET_RATIO did,
+# and holds in between
+DEFAULT_REFRESH_TTL = 3600
+MIN_REFRESH_TTL = 300
+MAX_REFRESH_TTL = 86400
+REFRESH_BUSY_RATIO = 0.05
+REFRESH_QUIET_RATIO = 0.01
+
+# Document fields that churn on their own (presence, voice, day-counted ages); they are still written when
+# they change, but don't count as a change when adapting the refresh interval
+VOLATILE_FIELDS = frozenset({
+	"status", "mobile_status", "desktop_status", "web_status", "activities", "activity_count",
+	"voice_channel_id", "account_age_days", "current_users", "user_list", "last_message_id"
+})
+
+# Member documents per write batch, batches buffered ahead of the writers, and writers per guild
+MEMBER_CHUNK_SIZE = 1000
+MEMBER_CHUNK_BUFFER = 4
+MEMBER_WRITERS = 2
+
+# Member attributes read once per document; several are computed properties (roles, top_role,
+# guild_permissions, display_avatar) that used to be evaluated repeatedly
+_MEMBER_ATTRS = attrgetter(
+	'id', 'name', 'global_name', 'display_name', 'discriminator', 'bot', 'system',
+	'joined_at', 'premium_since', 'roles', 'top_role', 'guild_permissions', 'display_avatar', 'created_at'
+)
+
+# Concurrent archived-thread requests per guild refresh
+THREAD_FETCH_CONCURRENCY = 5
+
+# Upper bound on remembered document hashes, keyed by (collection, guild_id, id)
+DOCUMENT_HASH_CACHE_SIZE = 200_000
+
+# On-disk copy of the document hashes so a restart doesn't rewrite every guild; logs/ is the mounted volume
+CACHE_STATE_PATH = os.environ.get("CACHE_STATE_PATH", os.path.join("logs", "cache_state.sqlite3"))
+
+# Permission bitmasks used to classify cached roles
+DANGEROUS_PERMISSIONS_MASK = discord.Permissions(
+	administrator=True, manage_guild=True, manage_roles=True, manage_channels=True,
+	kick_members=True, ban_members=True, manage_messages=True, mention_everyone=True
+).value
+MODERATION_PERMISSIONS_MASK = discord.Permissions(
+	kick_members=True, ban_members=True, manage_messages=True, mute_members=True,
+	deafen_members=True, move_members=True
+).value
+
+
+def _content_digest(content: Dict) -> bytes:
+	payload = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+	return hashlib.blake2b(payload.encode(), digest_size=8).digest()
+
+
+def _document_hash(document: Dict) -> bytes:
+	"""
+	Stable digest of a cached document's content, ignoring its write timestamp.
+
+	The first 8 bytes cover the regular fields and the last 8 the VOLATILE_FIELDS, so a
+	refresh can tell a real change from presence churn.
+	"""
+	stable = {}
+	volatile = {}
+	for key, value in document.items():
+		if key in ("updated_at", "_id"):
+			continue
+		(volatile if key in VOLATILE_FIELDS else stable)[key] = value
+	return _content_digest(stable) + _content_digest(volatile)
+
 
 class GuildCacheManager:
 	def __init__(self, mongo_uri: str):
@@ -31,7 +119,20 @@ class GuildCacheManager:
 		self._members: Optional[AsyncIOMotorCollection] = None
 		self._analytics: Optional[AsyncIOMotorCollection] = None  # New analytics collection
 		self._events: Optional[AsyncIOMotorCollection] = None  # New events tracking collection
-		self._cache_locks = {}  # Per-guild locks for thread safety
+		# Per-guild locks for thread safety; an entry lives only while some task holds or awaits it
+		self._cache_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+		self._last_refresh: Dict[int, datetime] = {}  # guild_id -> updated_at of its Guilds record
+		self._refresh_ttl: Dict[int, int] = {}  # guild_id -> current refresh interval (ttl_hint)
+		self._refresh_changes: Dict[int, List[int]] = {}  # guild_id -> [changed, unchanged] during a refresh
+		# guild_id -> (structural signature, time.monotonic()) at its last clean channel/role rebuild
+		self._guild_sigs: Dict[int, tuple] = {}
+		self._write_sem: Optional[asyncio.Semaphore] = None  # Caps bulk writes in flight across all guilds
+		# LRU of the last written content hash per document, so unchanged entities can skip the write
+		self._hash_cache: OrderedDict = OrderedDict()
+		self._state_db: Optional[sqlite3.Connection] = None
+		# sqlite calls block, so they run on one worker thread, which also keeps them in order;
+		# started by initialize() and shut down by close()
+		self._state_executor: Optional[ThreadPoolExecutor] = None
 		self._initialized = False
 
 		# Enhanced real-time cache for frequently accessed data
@@ -59,12 +160,19 @@ class GuildCacheManager:
 			self._analytics = self._db["Analytics"]
 			self._events = self._db["Events"]
 
+			# Concurrent bulk writes contend on collection locks and the connection pool, so bound them
+			self._write_sem = asyncio.Semaphore(int(os.environ.get("CACHE_WRITE_CONCURRENCY", "4")))
+
 			# Test the connection
 			await self._client.admin.command('ping')
 
 			# Create indexes for better performance
 			await self._create_indexes()
 
+			if self._state_executor is None:
+				self._state_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-state")
+			await self._load_state()
+
 			self._initialized = True
 			logger.info("GuildCacheManager database connection initialized successfully")
 
@@ -74,21 +182,36 @@ class GuildCacheManager:
 
 	async def _create_indexes(self):
 		"""Create database indexes for optimal performance"""
-		try:
-			# Guild-based indexes
-			await self._channels.create_index([("guild_id", 1), ("type", 1)])
-			await self._members.create_index([("guild_id", 1), ("bot", 1)])
-			await self._roles.create_index([("guild_id", 1), ("position", 1)])
-			await self._analytics.create_index([("guild_id", 1), ("date", -1)])
-			await self._events.create_index([("guild_id", 1), ("timestamp", -1)])
-
-			# Time-based indexes for analytics
-			await self._analytics.create_index([("date", -1)])
-			await self._events.create_index([("timestamp", -1)])
+		# The (guild_id, id) keys back every upsert filter; first-time caching inserts also rely on
+		# them to reject duplicates
+		entity_key = IndexModel([("guild_id", 1), ("id", 1)], unique=True)
+		indexes = {
+			self._channels: [IndexModel([("guild_id", 1), ("type", 1)]), entity_key],
+			self._members: [IndexModel([("guild_id", 1), ("bot", 1)]), entity_key],
+			self._roles: [IndexModel([("guild_id", 1), ("position", 1)]), entity_key],
+			self._servers: [
+				IndexModel([("id", 1)], unique=True),
+				# Covers cleanup_stale_data's range scan and its id projection
+				IndexModel([("updated_at", 1), ("id", 1)])
+			],
+			# Guild-based and time-based indexes for analytics
+			self._analytics: [IndexModel([("guild_id", 1), ("date", -1)]), IndexModel([("date", -1)])],
+			self._events: [IndexModel([("guild_id", 1), ("timestamp", -1)]), IndexModel([("timestamp", -1)])],
+		}
 
+		# One createIndexes command per collection, all in flight together
+		results = await asyncio.gather(
+			*(collection.create_indexes(models) for collection, models in indexes.items()),
+			return_exceptions=True
+		)
+
+		failed = False
+		for collection, result in zip(indexes, results):
+			if isinstance(result, Exception):
+				failed = True
+				logger.warning(f"Error creating indexes on {collection.name}: {result}")
+		if not failed:
 			logger.debug("Database indexes created successfully")
-		except Exception as e:
-			logger.warning(f"Error creating indexes: {e}")
 
 	async def close(self):
 		"""Close the database connection."""
@@ -96,6 +219,13 @@ class GuildCacheManager:
 			self._client.close()
 			self._initialized = False
 			logger.info("GuildCacheManager database connection closed")
+		if self._state_db is not None:
+			await self._run_state(self._state_db.close)
+			self._state_db = None
+		if self._state_executor is not None:
+			# The close above was its last job, so this returns as soon as the thread exits
+			self._state_executor.shutdown(wait=True)
+			self._state_executor = None
 
 	def _ensure_initialized(self):
 		"""Ensure the database connection is initialized."""
@@ -140,9 +270,11 @@ class GuildCacheManager:
 
 	def _get_guild_lock(self, guild_id: int) -> asyncio.Lock:
 		"""Get or create a lock for a specific guild to prevent race conditions."""
-		if guild_id not in self._cache_locks:
-			self._cache_locks[guild_id] = asyncio.Lock()
-		return self._cache_locks[guild_id]
+		lock = self._cache_locks.get(guild_id)
+		if lock is None:
+			lock = asyncio.Lock()
+			self._cache_locks[guild_id] = lock
+		return lock
 
 	async def cache_all(self, guild: discord.Guild, force_refresh: bool = False):
 		"""Cache all guild data with optional force refresh and better error handling."""
@@ -152,20 +284,54 @@ class GuildCacheManager:
 			try:
 				logger.info(f"Starting cache operation for guild {guild.name} ({guild.id})")
 
+				try:
+					last_cached = await self._get_last_cached(guild)
+				except Exception as e:
+					logger.warning(f"Error checking cache freshness for guild {guild.id}: {e}")
+					last_cached = {}  # Refresh on error, but don't assume the guild is new
+
 				# Check if we need to refresh based on last update time
-				if not force_refresh and not await self._should_refresh_cache(guild):
+				if not force_refresh and not self._is_cache_stale(guild, last_cached):
 					logger.info(f"Cache for guild {guild.name} is still fresh, skipping")
 					return
 
-				# Run all caching operations concurrently for better performance
-				await asyncio.gather(
-					self.cache_guild_info(guild),
-					self.cache_channels(guild),
-					self.cache_roles(guild),
-					self.cache_members(guild),
-					self.cache_guild_analytics(guild),
-					return_exceptions=True
-				)
+				# A guild with no cached record yet can take plain inserts instead of upserts
+				first_time = last_cached is None
+				self._refresh_changes[guild.id] = [0, 0]
+
+				# Channels and roles only need rebuilding when the guild's structure moved. The signature
+				# can't see role assignments, permission edits or voice occupancy, so the docs that carry
+				# them are still rebuilt at least once per DEFAULT_REFRESH_TTL
+				signature = self._guild_signature(guild)
+				last_signature, last_rebuild = self._guild_sigs.get(guild.id, (None, 0.0))
+				structure_unchanged = (not force_refresh and last_signature == signature
+									   and time.monotonic() - last_rebuild < DEFAULT_REFRESH_TTL)
+
+				operations = [self.cache_guild_info(guild)]
+				if structure_unchanged:
+					logger.debug(f"Channels and roles for guild {guild.name} are unchanged, skipping them")
+				else:
+					operations.append(self.cache_channels(guild, first_time=first_time))
+					operations.append(self.cache_roles(guild, first_time=first_time))
+				operations.append(self.cache_members(guild, first_time=first_time))
+				operations.append(self.cache_guild_analytics(guild))
+
+				if (guild.member_count or 0) > LARGE_GUILD_MEMBER_THRESHOLD:
+					# Large guilds write big batches; running them back to back avoids lock thrashing
+					results = []
+					for operation in operations:
+						try:
+							results.append(await operation)
+						except Exception as e:
+							results.append(e)  # Each cache step logs its own failures
+				else:
+					# Run all caching operations concurrently for better performance
+					results = await asyncio.gather(*operations, return_exceptions=True)
+
+				if not structure_unchanged and not any(isinstance(result, Exception) for result in results):
+					self._guild_sigs[guild.id] = (signature, time.monotonic())
+
+				await self._update_refresh_ttl(guild, self._refresh_changes.pop(guild.id, None))
 
 				logger.info(f"Completed cache operation for guild {guild.name} ({guild.id})")
 
@@ -173,30 +339,232 @@ class GuildCacheManager:
 				logger.error(f"Error caching guild {guild.name} ({guild.id}): {e}")
 				raise
 
-	async def _should_refresh_cache(self, guild: discord.Guild) -> bool:
-		"""Check if cache needs refreshing based on last update time."""
-		try:
-			last_cached = await self.servers.find_one(
-				{"id": guild.id},
-				{"updated_at": 1}
-			)
+	@staticmethod
+	def _guild_signature(guild: discord.Guild) -> int:
+		"""Cheap fingerprint of a guild's structure: size, boost tier, and channel/role ids and names."""
+		return hash((
+			guild.member_count,
+			guild.premium_tier,
+			tuple(sorted((channel.id, channel.name) for channel in guild.channels)),
+			tuple(sorted((role.id, role.name) for role in guild.roles)),
+		))
+
+	async def _get_last_cached(self, guild: discord.Guild) -> Optional[Dict]:
+		"""
+		Fetch the cached guild record's update time, or None if the guild was never cached.
 
+		Only a cold start reads the record from Mongo; after that the time this process
+		last wrote (or read) is served from memory.
+		"""
+		last_refresh = self._last_refresh.get(guild.id)
+		if last_refresh is not None:
+			return {"updated_at": last_refresh, "ttl_hint": self._refresh_ttl.get(guild.id, DEFAULT_REFRESH_TTL)}
+
+		last_cached = await self.servers.find_one(
+			{"id": guild.id},
+			{"updated_at": 1, "ttl_hint": 1}
+		)
+		if last_cached and "updated_at" in last_cached:
+			last_cached["updated_at"] = datetime.fromisoformat(last_cached["updated_at"])
+			self._last_refresh[guild.id] = last_cached["updated_at"]
+		if last_cached and "ttl_hint" in last_cached:
+			self._refresh_ttl[guild.id] = last_cached["ttl_hint"]
+		return last_cached
+
+	def _is_cache_stale(self, guild: discord.Guild, last_cached: Optional[Dict]) -> bool:
+		"""Check if a cached guild record is old enough to refresh."""
+		try:
 			if not last_cached or "updated_at" not in last_cached:
 				return True
 
-			# Refresh if older than 1 hour
-			last_update = pendulum.parse(last_cached["updated_at"])
-			return pendulum.now("America/Chicago").diff(last_update).in_hours() >= 1
+			# Refresh once the guild's adaptive interval has passed
+			ttl = last_cached.get("ttl_hint", DEFAULT_REFRESH_TTL)
+			return (datetime.now(timezone.utc) - last_cached["updated_at"]).total_seconds() >= ttl
 
 		except Exception as e:
 			logger.warning(f"Error checking cache freshness for guild {guild.id}: {e}")
 			return True  # Refresh on error
 
+	async def _update_refresh_ttl(self, guild: discord.Guild, counts: Optional[List[int]]):
+		"""Adjust a guild's refresh interval from what the refresh found and persist it as ttl_hint."""
+		if not counts or not any(counts):
+			# Nothing had a remembered hash to compare against (new guild or a restart)
+			return
+
+		changed, unchanged = counts
+		ratio = changed / (changed + unchanged)
+		current = self._refresh_ttl.get(guild.id, DEFAULT_REFRESH_TTL)
+		if ratio >= REFRESH_BUSY_RATIO:
+			ttl = max(MIN_REFRESH_TTL, current // 2)
+		elif ratio < REFRESH_QUIET_RATIO:
+			ttl = min(MAX_REFRESH_TTL, current * 2)
+		else:
+			ttl = current
+		if ttl == current and guild.id in self._refresh_ttl:
+			return
+		self._refresh_ttl[guild.id] = ttl
+
+		try:
+			await self.servers.update_one({"id": guild.id}, {"$set": {"ttl_hint": ttl}})
+		except Exception as e:
+			logger.warning(f"Error saving refresh interval for guild {guild.id}: {e}")
+
+	async def _write_guild_documents(self, collection: AsyncIOMotorCollection, guild_id: int,
+									 documents: List[Dict], first_time: bool = False):
+		"""
+		Write a batch of per-guild documents keyed by (guild_id, id).
+
+		Documents whose content matches the last write are dropped from the batch. For a
+		guild that was never cached the batch is inserted outright, skipping the upsert's
+		match step; if some documents turn out to exist already (duplicate key), the batch
+		falls back to replacing by key.
+		"""
+		hashes = []
+		changed = []
+		counts = self._refresh_changes.get(guild_id)
+		for document in documents:
+			key = (collection.name, guild_id, document["id"])
+			digest = _document_hash(document)
+			previous = None if first_time else self._hash_cache.get(key)
+			# Hashes stored before the volatile split are a different length and can't be compared by part
+			if previous is not None and counts is not None and len(previous) == len(digest):
+				# Only the regular fields feed the refresh interval; volatile churn alone counts as unchanged
+				counts[0 if previous[:8] != digest[:8] else 1] += 1
+			if previous == digest:
+				self._hash_cache.move_to_end(key)
+				continue
+			hashes.append((key, digest))
+			# Encode once up front; the insert and any upsert fallback reuse the same bytes
+			changed.append(RawBSONDocument(encode(document)))
+
+		if not changed:
+			return
+
+		await self._write_documents(collection, guild_id, changed, first_time)
+
+		# Only remember hashes once the write went through
+		for key, digest in hashes:
+			self._hash_cache[key] = digest
+			self._hash_cache.move_to_end(key)
+		evicted = []
+		while len(self._hash_cache) > DOCUMENT_HASH_CACHE_SIZE:
+			evicted.append(self._hash_cache.popitem(last=False)[0])
+		await self._run_state(self._save_hashes, hashes, evicted)
+
+	async def _forget_hashes(self, guild_id: int, collection: AsyncIOMotorCollection, entity_id: int):
+		"""Drop a remembered document hash so the next refresh rewrites that document."""
+		key = (collection.name, guild_id, entity_id)
+		self._hash_cache.pop(key, None)
+		await self._run_state(self._save_hashes, [], [key])
+
+	async def _forget_guilds(self, guild_ids: Set[int]):
+		"""Drop every in-memory trace of guilds whose cached records were deleted."""
+		for key in [key for key in self._hash_cache if key[1] in guild_ids]:
+			del self._hash_cache[key]
+		await self._run_state(self._delete_guild_hashes, list(guild_ids))
+		for guild_id in guild_ids:
+			self._last_refresh.pop(guild_id, None)
+			self._refresh_ttl.pop(guild_id, None)
+			self._guild_sigs.pop(guild_id, None)
+			self._memory_cache['guild_stats'].pop(guild_id, None)
+			self._memory_cache['recent_events'].pop(guild_id, None)
+
+	async def _run_state(self, func, *args):
+		"""Run a blocking state-store call on the state thread; failures only cost the warm restart."""
+		if self._state_db is None:
+			return None
+		try:
+			return await asyncio.get_running_loop().run_in_executor(self._state_executor, func, *args)
+		except Exception as e:
+			logger.warning(f"Error updating cache state store: {e}")
+			return None
+
+	async def _load_state(self):
+		"""Open the on-disk state store and seed the document hash cache from it."""
+		try:
+			self._state_db, rows = await asyncio.get_running_loop().run_in_executor(
+				self._state_executor, self._open_state_store
+			)
+		except Exception as e:
+			logger.warning(f"Cache state store unavailable, document hashes won't survive restarts: {e}")
+			return
+
+		for kind, guild_id, entity_id, digest in rows:
+			self._hash_cache[(kind, guild_id, entity_id)] = digest
+		logger.debug(f"Loaded {len(rows)} document hashes from {CACHE_STATE_PATH}")
+
+	@staticmethod
+	def _open_state_store():
+		directory = os.path.dirname(CACHE_STATE_PATH)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+
+		conn = sqlite3.connect(CACHE_STATE_PATH, check_same_thread=False)
+		conn.execute("PRAGMA journal_mode=WAL")
+		conn.execute("PRAGMA synchronous=NORMAL")
+		conn.execute(
+			"CREATE TABLE IF NOT EXISTS cache_state ("
+			"kind TEXT NOT NULL, guild_id INTEGER NOT NULL, entity_id INTEGER NOT NULL, hash BLOB NOT NULL, "
+			"PRIMARY KEY (kind, guild_id, entity_id))"
+		)
+		rows = conn.execute(
+			"SELECT kind, guild_id, entity_id, hash FROM cache_state LIMIT ?",
+			(DOCUMENT_HASH_CACHE_SIZE,)
+		).fetchall()
+		return conn, rows
+
+	def _save_hashes(self, hashes: List, removed: List):
+		with self._state_db:
+			if hashes:
+				self._state_db.executemany(
+					"INSERT OR REPLACE INTO cache_state (kind, guild_id, entity_id, hash) VALUES (?, ?, ?, ?)",
+					[(*key, digest) for key, digest in hashes]
+				)
+			if removed:
+				self._state_db.executemany(
+					"DELETE FROM cache_state WHERE kind = ? AND guild_id = ? AND entity_id = ?",
+					removed
+				)
+
+	def _delete_guild_hashes(self, guild_ids: List[int]):
+		with self._state_db:
+			self._state_db.executemany(
+				"DELETE FROM cache_state WHERE guild_id = ?",
+				[(guild_id,) for guild_id in guild_ids]
+			)
+
+	async def _write_documents(self, collection: AsyncIOMotorCollection, guild_id: int,
+							   documents: List[Dict], first_time: bool):
+		"""Insert or replace a batch of pre-encoded per-guild documents under the write semaphore."""
+		if first_time:
+			try:
+				async with self._write_sem:
+					await collection.insert_many(documents, ordered=False)
+				return
+			except BulkWriteError as e:
+				if any(err.get("code") != 11000 for err in e.details.get("writeErrors", [])):
+					raise
+				# Raw documents carry no client-side _id, so the same batch can be replayed as replacements
+				logger.debug(f"Documents already cached for guild {guild_id}, falling back to upserts")
+
+		operations = [
+			ReplaceOne(
+				{"guild_id": guild_id, "id": document["id"]},
+				document,
+				upsert=True
+			)
+			for document in documents
+		]
+		async with self._write_sem:
+			await collection.bulk_write(operations, ordered=False)
+
 	async def cache_guild_info(self, guild: discord.Guild):
 		"""Enhanced guild info caching with additional metadata and analytics integration."""
 		try:
+			now = datetime.now(timezone.utc)
+
 			# Get additional guild features and settings
-			features = list(guild.features) if guild.features else []
+			features = list(guild.features)
 
 			# Calculate enhanced metrics
 			bot_count = sum(1 for member in guild.members if member.bot)
@@ -207,8 +575,8 @@ class GuildCacheManager:
 			# Get premium subscriber count
 			premium_members = sum(1 for member in guild.members if member.premium_since)
 
+			# id comes from the upsert filter and created_at never changes, so neither is re-sent
 			data = {
-				"id": guild.id,
 				"name": guild.name,
 				"icon_url": str(guild.icon.url) if guild.icon else None,
 				"banner_url": str(guild.banner.url) if guild.banner else None,
@@ -228,9 +596,8 @@ class GuildCacheManager:
 				"premium_tier": guild.premium_tier,
 				"premium_subscription_count": guild.premium_subscription_count,
 				"features": features,
-				"created_at": guild.created_at.isoformat(),
-				"updated_at": pendulum.now("America/Chicago").isoformat(),
-				"cache_version": "3.0",  # Updated version
+				"updated_at": now.astimezone(_CHICAGO).isoformat(),
+				"cache_version": CACHE_VERSION,
 
 				# Enhanced metadata
 				"total_channels": len(guild.channels),
@@ -247,9 +614,10 @@ class GuildCacheManager:
 
 			await self.servers.update_one(
 				{"id": guild.id},
-				{"$set": data},
+				{"$set": data, "$setOnInsert": {"created_at": guild.created_at.isoformat()}},
 				upsert=True
 			)
+			self._last_refresh[guild.id] = now
 
 			# Update memory cache
 			self._memory_cache['guild_stats'][guild.id] = {
@@ -266,10 +634,13 @@ class GuildCacheManager:
 			logger.error(f"Error caching guild info for {guild.name}: {e}")
 			raise
 
-	async def cache_channels(self, guild: discord.Guild):
+	async def cache_channels(self, guild: discord.Guild, first_time: bool = False):
 		"""Enhanced channel caching with better categorization and thread support."""
 		try:
 			cached_channels = []
+			thread_targets = []  # (channel, channel_data) pairs whose archived threads are fetched afterwards
+			# One timestamp for the whole batch
+			now_iso = datetime.now(_CHICAGO).isoformat()
 
 			for channel in guild.channels:
 				try:
@@ -279,14 +650,8 @@ class GuildCacheManager:
 						# channel.overwrites is a mapping: target (Role|Member) -> PermissionOverwrite
 						for target, overwrite in (channel.overwrites or {}).items():
 							try:
-								# Build allow/deny bitfields from the PermissionOverwrite
-								allow = discord.Permissions.none()
-								deny = discord.Permissions.none()
-								for name, value in overwrite:
-									if value is True:
-										setattr(allow, name, True)
-									elif value is False:
-										setattr(deny, name, True)
+								# pair() hands back the allow/deny bitfields of the PermissionOverwrite
+								allow, deny = overwrite.pair()
 
 								permissions.append({
 									"id": target.id,
@@ -309,7 +674,7 @@ class GuildCacheManager:
 						"position": channel.position,
 						"permissions": permissions,
 						"created_at": channel.created_at.isoformat(),
-						"updated_at": pendulum.now("America/Chicago").isoformat(),
+						"updated_at": now_iso,
 					}
 
 					# Add category-specific data
@@ -327,23 +692,9 @@ class GuildCacheManager:
 							"message_history_enabled": True,  # Assume enabled unless proven otherwise
 						})
 
-						# Cache active threads if any
+						# Archived threads are fetched for all text channels at once below
 						if hasattr(channel, 'threads'):
-							threads = []
-							try:
-								async for thread in channel.archived_threads(limit=50):
-									threads.append({
-										"id": thread.id,
-										"name": thread.name,
-										"archived": thread.archived,
-										"locked": thread.locked,
-										"created_at": thread.created_at.isoformat()
-									})
-								channel_data["archived_threads"] = threads
-								channel_data["thread_count"] = len(threads)
-							except (discord.Forbidden, discord.HTTPException):
-								channel_data["archived_threads"] = []
-								channel_data["thread_count"] = 0
+							thread_targets.append((channel, channel_data))
 
 					# Add voice channel specific data
 					elif isinstance(channel, discord.VoiceChannel):
@@ -370,49 +721,67 @@ class GuildCacheManager:
 					logger.error(f"Error processing channel {channel.name}: {channel_error}")
 					continue
 
-			# Batch update channels for better performance
-			if cached_channels:
-				operations = [
-					UpdateOne(
-						{"guild_id": guild.id, "id": ch["id"]},
-						{"$set": ch},
-						upsert=True
-					)
-					for ch in cached_channels
-				]
+			if thread_targets:
+				await self._attach_archived_threads(thread_targets)
 
-				await self.channels.bulk_write(operations, ordered=False)
+			# Batch update channels for better performance; each document is rebuilt in full, so replace it
+			if cached_channels:
+				await self._write_guild_documents(self.channels, guild.id, cached_channels, first_time)
 				logger.debug(f"Cached {len(cached_channels)} channels for {guild.name}")
 
 		except Exception as e:
 			logger.error(f"Error caching channels for {guild.name}: {e}")
 			raise
 
-	async def cache_roles(self, guild: discord.Guild):
+	@staticmethod
+	async def _attach_archived_threads(thread_targets: List):
+		"""Fetch archived threads for several channels concurrently and store them on their documents."""
+		sem = asyncio.Semaphore(THREAD_FETCH_CONCURRENCY)
+
+		async def fetch_threads(channel) -> List[Dict]:
+			async with sem:
+				return [
+					{
+						"id": thread.id,
+						"name": thread.name,
+						"archived": thread.archived,
+						"locked": thread.locked,
+						"created_at": thread.created_at.isoformat()
+					}
+					async for thread in channel.archived_threads(limit=50)
+				]
+
+		results = await asyncio.gather(
+			*(fetch_threads(channel) for channel, _ in thread_targets),
+			return_exceptions=True
+		)
+
+		for (channel, channel_data), threads in zip(thread_targets, results):
+			if isinstance(threads, Exception):
+				if not isinstance(threads, (discord.Forbidden, discord.HTTPException)):
+					logger.warning(f"Error fetching archived threads for channel {channel.name}: {threads}")
+				threads = []
+			channel_data["archived_threads"] = threads
+			channel_data["thread_count"] = len(threads)
+
+	async def cache_roles(self, guild: discord.Guild, first_time: bool = False):
 		"""Enhanced role caching with better permission analysis and hierarchy tracking."""
 		try:
 			cached_roles = []
+			# One timestamp for the whole batch
+			now_iso = datetime.now(_CHICAGO).isoformat()
+
+			# role.members scans the whole member list, so count every role in one pass instead
+			role_member_counts = Counter()
+			for member in guild.members:
+				role_member_counts.update(role.id for role in member.roles)
 
 			for role in guild.roles:
 				try:
 					# Analyze role permissions for better insights
-					dangerous_perms = [
-						"administrator", "manage_guild", "manage_roles", "manage_channels",
-						"kick_members", "ban_members", "manage_messages", "mention_everyone"
-					]
-
-					moderation_perms = [
-						"kick_members", "ban_members", "manage_messages", "mute_members",
-						"deafen_members", "move_members"
-					]
-
-					has_dangerous_perms = any(
-						getattr(role.permissions, perm, False) for perm in dangerous_perms
-					)
-
-					has_moderation_perms = any(
-						getattr(role.permissions, perm, False) for perm in moderation_perms
-					)
+					permissions_value = role.permissions.value
+					has_dangerous_perms = bool(permissions_value & DANGEROUS_PERMISSIONS_MASK)
+					has_moderation_perms = bool(permissions_value & MODERATION_PERMISSIONS_MASK)
 
 					role_data = {
 						"guild_id": guild.id,
@@ -420,7 +789,7 @@ class GuildCacheManager:
 						"name": role.name,
 						"color": str(role.color),
 						"color_value": role.color.value,
-						"permissions": role.permissions.value,
+						"permissions": permissions_value,
 						"position": role.position,
 						"mentionable": role.mentionable,
 						"hoist": role.hoist,
@@ -429,9 +798,9 @@ class GuildCacheManager:
 						"is_premium_subscriber": role.is_premium_subscriber(),
 						"has_dangerous_permissions": has_dangerous_perms,
 						"has_moderation_permissions": has_moderation_perms,
-						"member_count": len(role.members),
+						"member_count": role_member_counts[role.id],
 						"created_at": role.created_at.isoformat(),
-						"updated_at": pendulum.now("America/Chicago").isoformat(),
+						"updated_at": now_iso,
 
 						# Additional metadata
 						"display_icon": str(role.display_icon) if hasattr(role,
@@ -447,125 +816,186 @@ class GuildCacheManager:
 
 			# Batch update roles
 			if cached_roles:
-				operations = [
-					UpdateOne(
-						{"guild_id": guild.id, "id": role["id"]},
-						{"$set": role},
-						upsert=True
-					)
-					for role in cached_roles
-				]
-
-				await self.roles.bulk_write(operations, ordered=False)
+				await self._write_guild_documents(self.roles, guild.id, cached_roles, first_time)
 				logger.debug(f"Cached {len(cached_roles)} roles for {guild.name}")
 
 		except Exception as e:
 			logger.error(f"Error caching roles for {guild.name}: {e}")
 			raise
 
-	async def cache_members(self, guild: discord.Guild):
+	def _member_document(self, guild: discord.Guild, member: discord.Member,
+						 now: Optional[datetime] = None, now_iso: Optional[str] = None) -> Dict:
+		"""
+		Build the cached document for a single member.
+
+		Batch callers pass now (UTC) and now_iso (the updated_at stamp) so every document
+		in the batch shares one clock read.
+		"""
+		if now is None:
+			now = datetime.now(timezone.utc)
+		if now_iso is None:
+			now_iso = now.astimezone(_CHICAGO).isoformat()
+
+		(member_id, name, global_name, display_name, discriminator, bot, system,
+		 joined_at, premium_since, roles, top_role, guild_permissions, display_avatar, created_at) = _MEMBER_ATTRS(member)
+		avatar_url = str(display_avatar.url)
+		role_ids = [role.id for role in roles if not role.is_default()]
+
+		# Calculate account age
+		account_age = (now - created_at).days
+
+		# Check if member has any suspicious indicators
+		suspicious_indicators = []
+		if account_age < 7:
+			suspicious_indicators.append("very_new_account")
+		if not display_avatar or avatar_url.endswith("avatars/0.png"):
+			suspicious_indicators.append("default_avatar")
+		if len(roles) <= 1:  # Only @everyone role
+			suspicious_indicators.append("no_roles")
+
+		# Enhanced member data
+		member_data = {
+			"guild_id": guild.id,
+			"id": member_id,
+			"username": name,
+			"global_name": global_name,
+			"display_name": display_name or name,
+			"discriminator": discriminator,
+			"bot": bot,
+			"system": system,
+			"joined_at": joined_at.isoformat() if joined_at else None,
+			"premium_since": premium_since.isoformat() if premium_since else None,
+			"roles": role_ids,
+			"role_count": len(role_ids),
+			"top_role_id": top_role.id if top_role else None,
+			"top_role_position": top_role.position if top_role else 0,
+			"permissions": guild_permissions.value,
+			"avatar_url": avatar_url,
+			"status": str(member.status) if hasattr(member, 'status') else None,
+			"mobile_status": str(member.mobile_status) if hasattr(member, 'mobile_status') else None,
+			"desktop_status": str(member.desktop_status) if hasattr(member, 'desktop_status') else None,
+			"web_status": str(member.web_status) if hasattr(member, 'web_status') else None,
+			"created_at": created_at.isoformat(),
+			"account_age_days": account_age,
+			"suspicious_indicators": suspicious_indicators,
+			"updated_at": now_iso,
+
+			# Enhanced metadata
+			"is_owner": member_id == guild.owner_id,
+			"guild_permissions_value": guild_permissions.value,
+			"voice_channel_id": member.voice.channel.id if member.voice else None,
+		}
+
+		# Add activity information if available
+		if hasattr(member, 'activities') and member.activities:
+			activities = []
+			for activity in member.activities:
+				activity_data = {
+					"name": activity.name,
+					"type": str(activity.type),
+				}
+				if hasattr(activity, 'state') and activity.state:
+					activity_data["state"] = activity.state
+				if hasattr(activity, 'details') and activity.details:
+					activity_data["details"] = activity.details
+				if hasattr(activity, 'start') and activity.start:
+					activity_data["start"] = activity.start.isoformat()
+				activities.append(activity_data)
+			member_data["activities"] = activities
+			member_data["activity_count"] = len(activities)
+
+		return member_data
+
+	def _iter_member_documents(self, guild: discord.Guild, now: datetime, now_iso: str):
+		"""Yield cached member documents for a guild, skipping members that fail to serialise."""
+		for member in guild.members:
+			try:
+				yield self._member_document(guild, member, now, now_iso)
+
+			except Exception as member_error:
+				logger.error(f"Error processing member {member.name}: {member_error}")
+				continue
+
+	async def cache_members(self, guild: discord.Guild, first_time: bool = False):
 		"""Enhanced member caching with activity tracking and better data."""
 		try:
-			cached_members = []
+			now = datetime.now(timezone.utc)
+			now_iso = now.astimezone(_CHICAGO).isoformat()
+			member_documents = self._iter_member_documents(guild, now, now_iso)
+
+			# Batch update members with chunking for large guilds. Chunks are built while earlier ones
+			# are being written, and at most MEMBER_CHUNK_BUFFER of them wait in memory at a time.
+			queue: asyncio.Queue = asyncio.Queue(maxsize=MEMBER_CHUNK_BUFFER)
+			cached_count = 0
+			errors = []
+
+			async def produce():
+				while True:
+					chunk = list(islice(member_documents, MEMBER_CHUNK_SIZE))
+					if not chunk:
+						break
+					await queue.put(chunk)
+					await asyncio.sleep(0)  # Let the writers pick the chunk up before building the next
+				for _ in range(MEMBER_WRITERS):
+					await queue.put(None)
+
+			async def write():
+				nonlocal cached_count
+				while True:
+					chunk = await queue.get()
+					if chunk is None:
+						break
+					if errors:
+						continue  # Drain the queue so the producer never blocks
+					try:
+						await self._write_guild_documents(self.members, guild.id, chunk, first_time)
+						cached_count += len(chunk)
+					except Exception as e:
+						errors.append(e)
 
-			for member in guild.members:
-				try:
-					# Calculate account age
-					account_age = (datetime.now(timezone.utc) - member.created_at).days
-
-					# Check if member has any suspicious indicators
-					suspicious_indicators = []
-					if account_age < 7:
-						suspicious_indicators.append("very_new_account")
-					if not member.display_avatar or str(member.display_avatar.url).endswith("avatars/0.png"):
-						suspicious_indicators.append("default_avatar")
-					if len(member.roles) <= 1:  # Only @everyone role
-						suspicious_indicators.append("no_roles")
-
-					# Enhanced member data
-					member_data = {
-						"guild_id": guild.id,
-						"id": member.id,
-						"username": member.name,
-						"global_name": member.global_name,
-						"display_name": member.display_name or member.name,
-						"discriminator": member.discriminator,
-						"bot": member.bot,
-						"system": member.system,
-						"joined_at": member.joined_at.isoformat() if member.joined_at else None,
-						"premium_since": member.premium_since.isoformat() if member.premium_since else None,
-						"roles": [role.id for role in member.roles if not role.is_default()],
-						"role_count": len([role for role in member.roles if not role.is_default()]),
-						"top_role_id": member.top_role.id if member.top_role else None,
-						"top_role_position": member.top_role.position if member.top_role else 0,
-						"permissions": member.guild_permissions.value,
-						"avatar_url": str(member.display_avatar.url),
-						"status": str(member.status) if hasattr(member, 'status') else None,
-						"mobile_status": str(member.mobile_status) if hasattr(member, 'mobile_status') else None,
-						"desktop_status": str(member.desktop_status) if hasattr(member, 'desktop_status') else None,
-						"web_status": str(member.web_status) if hasattr(member, 'web_status') else None,
-						"created_at": member.created_at.isoformat(),
-						"account_age_days": account_age,
-						"suspicious_indicators": suspicious_indicators,
-						"updated_at": pendulum.now("America/Chicago").isoformat(),
-
-						# Enhanced metadata
-						"is_owner": member.id == guild.owner_id,
-						"guild_permissions_value": member.guild_permissions.value,
-						"voice_channel_id": member.voice.channel.id if member.voice else None,
-					}
+			await asyncio.gather(produce(), *(write() for _ in range(MEMBER_WRITERS)))
+			if errors:
+				raise errors[0]
 
-					# Add activity information if available
-					if hasattr(member, 'activities') and member.activities:
-						activities = []
-						for activity in member.activities:
-							activity_data = {
-								"name": activity.name,
-								"type": str(activity.type),
-							}
-							if hasattr(activity, 'state') and activity.state:
-								activity_data["state"] = activity.state
-							if hasattr(activity, 'details') and activity.details:
-								activity_data["details"] = activity.details
-							if hasattr(activity, 'start') and activity.start:
-								activity_data["start"] = activity.start.isoformat()
-							activities.append(activity_data)
-						member_data["activities"] = activities
-						member_data["activity_count"] = len(activities)
-
-					cached_members.append(member_data)
-
-				except Exception as member_error:
-					logger.error(f"Error processing member {member.name}: {member_error}")
-					continue
+			if cached_count:
+				logger.debug(f"Cached {cached_count} members for {guild.name}")
+
+		except Exception as e:
+			logger.error(f"Error caching members for {guild.name}: {e}")
+			raise
 
-			# Batch update members with chunking for large guilds
-			if cached_members:
-				chunk_size = 1000  # Process in chunks to avoid memory issues
-				for i in range(0, len(cached_members), chunk_size):
-					chunk = cached_members[i:i + chunk_size]
-					operations = [
-						UpdateOne(
-							{"guild_id": guild.id, "id": member["id"]},
-							{"$set": member},
-							upsert=True
-						)
-						for member in chunk
-					]
+	async def cache_member(self, guild: discord.Guild, member: discord.Member):
+		"""Upsert a single member's cached document, e.g. after they join."""
+		try:
+			await self.members.replace_one(
+				{"guild_id": guild.id, "id": member.id},
+				self._member_document(guild, member),
+				upsert=True
+			)
+			# Written outside the batch path, so the remembered hash no longer describes the document
+			await self._forget_hashes(guild.id, self.members, member.id)
+			logger.debug(f"Cached member {member.name} for {guild.name}")
 
-					await self.members.bulk_write(operations, ordered=False)
+		except Exception as e:
+			logger.error(f"Error caching member {member.name} for {guild.name}: {e}")
+			raise
 
-				logger.debug(f"Cached {len(cached_members)} members for {guild.name}")
+	async def remove_member(self, guild_id: int, member_id: int):
+		"""Drop a single member's cached document, e.g. after they leave."""
+		try:
+			await self.members.delete_one({"guild_id": guild_id, "id": member_id})
+			await self._forget_hashes(guild_id, self.members, member_id)
+			logger.debug(f"Removed cached member {member_id} for guild {guild_id}")
 
 		except Exception as e:
-			logger.error(f"Error caching members for {guild.name}: {e}")
+			logger.error(f"Error removing cached member {member_id} for guild {guild_id}: {e}")
 			raise
 
 	async def cache_guild_analytics(self, guild: discord.Guild):
 		"""Cache comprehensive guild analytics data"""
 		try:
-			now = pendulum.now("America/Chicago")
-			today = now.format('YYYY-MM-DD')
+			now = datetime.now(_CHICAGO)
+			today = now.strftime('%Y-%m-%d')
 
 			# Calculate various metrics
 			bot_count = sum(1 for member in guild.members if member.bot)
@@ -626,7 +1056,7 @@ class GuildCacheManager:
 				},
 				"voice_activity": voice_activity,
 				"age_distribution": age_distribution,
-				"guild_features": list(guild.features) if guild.features else [],
+				"guild_features": list(guild.features),
 				"verification_level": str(guild.verification_level),
 				"premium_tier": guild.premium_tier
 			}
@@ -648,7 +1078,7 @@ class GuildCacheManager:
 			event_record = {
 				"guild_id": guild_id,
 				"event_type": event_type,
-				"timestamp": pendulum.now("America/Chicago").isoformat(),
+				"timestamp": datetime.now(_CHICAGO).isoformat(),
 				"data": event_data
 			}
 
@@ -669,8 +1099,8 @@ class GuildCacheManager:
 	async def get_guild_activity_summary(self, guild_id: int, days: int = 7) -> Dict:
 		"""Get activity summary for a guild over specified days"""
 		try:
-			end_date = pendulum.now("America/Chicago")
-			start_date = end_date.subtract(days=days)
+			end_date = datetime.now(_CHICAGO)
+			start_date = end_date - timedelta(days=days)
 
 			# Get events in date range
 			events_cursor = self.events.find({
@@ -736,14 +1166,7 @@ class GuildCacheManager:
 				)
 
 				# Clean up memory cache
-				if guild_id in self._memory_cache['guild_stats']:
-					del self._memory_cache['guild_stats'][guild_id]
-				if guild_id in self._memory_cache['recent_events']:
-					del self._memory_cache['recent_events'][guild_id]
-
-				# Clean up the lock
-				if guild_id in self._cache_locks:
-					del self._cache_locks[guild_id]
+				await self._forget_guilds({guild_id})
 
 			except Exception as e:
 				logger.error(f"Error deleting guild cache for {guild_id}: {e}")
@@ -791,32 +1214,46 @@ class GuildCacheManager:
 	async def get_guild_statistics(self, guild_id: int) -> Dict:
 		"""Get comprehensive statistics about a cached guild."""
 		try:
-			stats = {
-				"total_channels": await self.channels.count_documents({"guild_id": guild_id}),
-				"total_roles": await self.roles.count_documents({"guild_id": guild_id}),
-				"total_members": await self.members.count_documents({"guild_id": guild_id}),
-				"bot_members": await self.members.count_documents({"guild_id": guild_id, "bot": True}),
-				"human_members": await self.members.count_documents({"guild_id": guild_id, "bot": False}),
-				"suspicious_members": await self.members.count_documents({
-					"guild_id": guild_id,
-					"suspicious_indicators": {"$exists": True, "$not": {"$size": 0}}
-				}),
-			}
-
-			# Get channel type breakdown
-			channel_types = await self.channels.aggregate([
+			# One grouped pass per collection, all issued concurrently
+			member_pipeline = [
+				{"$match": {"guild_id": guild_id}},
+				{"$group": {
+					"_id": None,
+					"total": {"$sum": 1},
+					"bots": {"$sum": {"$cond": [{"$eq": ["$bot", True]}, 1, 0]}},
+					"humans": {"$sum": {"$cond": [{"$eq": ["$bot", False]}, 1, 0]}},
+					"suspicious": {"$sum": {"$cond": [
+						{"$gt": [{"$size": {"$ifNull": ["$suspicious_indicators", []]}}, 0]}, 1, 0
+					]}},
+				}}
+			]
+			channel_pipeline = [
 				{"$match": {"guild_id": guild_id}},
 				{"$group": {"_id": "$type", "count": {"$sum": 1}}}
-			]).to_list(length=None)
-
-			stats["channel_types"] = {ct["_id"]: ct["count"] for ct in channel_types}
+			]
 
-			# Get latest analytics
-			latest_analytics = await self.analytics.find_one(
-				{"guild_id": guild_id},
-				sort=[("timestamp", -1)]
+			member_counts, channel_types, total_roles, latest_analytics = await asyncio.gather(
+				self.members.aggregate(member_pipeline).to_list(length=1),
+				self.channels.aggregate(channel_pipeline).to_list(length=None),
+				self.roles.count_documents({"guild_id": guild_id}),
+				self.analytics.find_one(
+					{"guild_id": guild_id},
+					sort=[("timestamp", -1)]
+				)
 			)
 
+			member_counts = member_counts[0] if member_counts else {}
+			stats = {
+				"total_channels": sum(ct["count"] for ct in channel_types),
+				"total_roles": total_roles,
+				"total_members": member_counts.get("total", 0),
+				"bot_members": member_counts.get("bots", 0),
+				"human_members": member_counts.get("humans", 0),
+				"suspicious_members": member_counts.get("suspicious", 0),
+				# Channel type breakdown
+				"channel_types": {ct["_id"]: ct["count"] for ct in channel_types},
+			}
+
 			if latest_analytics:
 				stats["latest_analytics"] = latest_analytics
 				stats["analytics_date"] = latest_analytics.get("date")
@@ -858,27 +1295,43 @@ class GuildCacheManager:
 	async def cleanup_stale_data(self, max_age_hours: int = 168):  # 1 week default
 		"""Clean up stale cached data older than specified hours."""
 		try:
-			cutoff_time = pendulum.now("America/Chicago").subtract(hours=max_age_hours)
-			cutoff_iso = cutoff_time.isoformat()
+			now = datetime.now(_CHICAGO)
+			cutoff_iso = (now - timedelta(hours=max_age_hours)).isoformat()
 
-			# Clean up stale guild data
+			# Clean up stale guild data; the (updated_at, id) index answers this without reading documents
 			stale_guilds = await self.servers.find(
-				{"updated_at": {"$lt": cutoff_iso}}
+				{"updated_at": {"$lt": cutoff_iso}},
+				{"id": 1, "_id": 0}
 			).to_list(length=None)
+			stale_ids = [guild_data["id"] for guild_data in stale_guilds]
+
+			deleted_count = len(stale_ids)
+			if stale_ids:
+				# One delete per collection for all stale guilds instead of a full delete_guild each
+				guild_filter = {"guild_id": {"$in": stale_ids}}
+				results = await asyncio.gather(
+					self.servers.delete_many({"id": {"$in": stale_ids}}),
+					self.channels.delete_many(guild_filter),
+					self.roles.delete_many(guild_filter),
+					self.members.delete_many(guild_filter),
+					self.analytics.delete_many(guild_filter),
+					self.events.delete_many(guild_filter),
+					return_exceptions=True
+				)
+				for result in results:
+					if isinstance(result, Exception):
+						logger.warning(f"Error deleting stale guild data: {result}")
 
-			deleted_count = 0
-			for guild_data in stale_guilds:
-				await self.delete_guild(guild_data["id"])
-				deleted_count += 1
+				await self._forget_guilds(set(stale_ids))
 
 			# Clean up old events (keep last 30 days)
-			old_events_cutoff = pendulum.now("America/Chicago").subtract(days=30).isoformat()
+			old_events_cutoff = (now - timedelta(days=30)).isoformat()
 			events_deleted = await self.events.delete_many({
 				"timestamp": {"$lt": old_events_cutoff}
 			})
 
 			# Clean up old analytics (keep last 90 days)
-			old_analytics_cutoff = pendulum.now("America/Chicago").subtract(days=90).format('YYYY-MM-DD')
+			old_analytics_cutoff = (now - timedelta(days=90)).strftime('%Y-%m-%d')
 			analytics_deleted = await self.analytics.delete_many({
 				"date": {"$lt": old_analytics_cutoff}
 			})
@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import Optional, Set
+from typing import Callable, Optional, Set
 from enum import IntEnum
 
 from discord import Interaction
@@ -62,13 +62,29 @@ class FakeContext:
 		self.channel = interaction.channel
 
 
-def cooldown_enforcer(cooldown_map: CooldownMapping, bucket_type: BucketType):
+def is_guild_administrator(interaction: Interaction) -> bool:
+	"""
+    Check if the invoking member has the Administrator permission in the guild.
+
+    The result is memoized on ``interaction.extras`` so permission checks that
+    run later in the same invocation can reuse it.
+    """
+	cached = interaction.extras.get("is_guild_administrator")
+	if cached is None:
+		perms = getattr(interaction.user, "guild_permissions", None)
+		cached = interaction.extras["is_guild_administrator"] = bool(perms and perms.administrator)
+	return cached
+
+
+def cooldown_enforcer(cooldown_map: CooldownMapping, bucket_type: BucketType,
+					  bypass: Optional[Callable[[Interaction], bool]] = None):
 	"""
     Creates a cooldown enforcer decorator for Discord slash commands.
 
     Args:
         cooldown_map: The cooldown mapping to use
         bucket_type: The bucket type for the cooldown
+        bypass: Optional predicate; when it returns True the bucket is never touched
 
     Returns:
         A decorator function that enforces the cooldown
@@ -95,6 +111,10 @@ def cooldown_enforcer(cooldown_map: CooldownMapping, bucket_type: BucketType):
 					logger.info(f"Admin bypass granted - User: {username} ({user_id}) in {guild_name}")
 					return True
 
+				if bypass is not None and bypass(interaction):
+					logger.info(f"Cooldown bypass granted - User: {username} ({user_id}) in {guild_name}")
+					return True
+
 				# Create context for bucket retrieval
 				fake_ctx = FakeContext(interaction)
 
@@ -131,11 +151,12 @@ def cooldown_enforcer(cooldown_map: CooldownMapping, bucket_type: BucketType):
 
 
 # Convenient pre-configured cooldown decorators with enhanced logging
-def _create_named_cooldown(config_attr: str, config: CooldownMapping, bucket_type: BucketType):
+def _create_named_cooldown(config_attr: str, config: CooldownMapping, bucket_type: BucketType,
+						   bypass: Optional[Callable[[Interaction], bool]] = None):
 	"""Helper to create named cooldown decorators with logging."""
 	logger.info(f"Initializing {config_attr} cooldown decorator - "
 				f"Rate: {config._cooldown.rate}, Per: {config._cooldown.per}s, Type: {bucket_type.name}")
-	return cooldown_enforcer(config, bucket_type)
+	return cooldown_enforcer(config, bucket_type, bypass=bypass)
 
 
 create_cooldown = _create_named_cooldown("CREATE", CooldownConfig.CREATE, BucketType.user)
@@ -143,7 +164,9 @@ create_color_cooldown = _create_named_cooldown("CREATE_COLOR", CooldownConfig.CR
 create_features = _create_named_cooldown("CREATE_FEATURES", CooldownConfig.CREATE_FEATURES, BucketType.user)
 edit_cooldown = _create_named_cooldown("EDIT", CooldownConfig.EDIT, BucketType.user)
 clone_cooldown = _create_named_cooldown("CLONE", CooldownConfig.CLONE, BucketType.user)
-welcome_cooldown = _create_named_cooldown("WELCOME", CooldownConfig.WELCOME, BucketType.user)
+# Administrators run repeated welcome tests, so they skip the bucket entirely
+welcome_cooldown = _create_named_cooldown("WELCOME", CooldownConfig.WELCOME, BucketType.user,
+										  bypass=is_guild_administrator)
 
 # Log cooldown system initialization
 logger.info("Cooldown system initialized successfully with the following configurations:")